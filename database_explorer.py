@@ -5,43 +5,144 @@ Database access examples for the web scraper.
 
 import sys
 import os
+
+try:
+    import readline  # noqa: F401 - gives input() line editing and history
+except ImportError:
+    pass
+
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import orjson
 from src.database import db_manager
 from src.models import Platform
 from sqlalchemy import text
 
+# Statements behind the interactive commands, built once at import so each
+# command reuses the same statement object and compiled-cache entry
+STATS_SQL = text("""
+    SELECT 'total' AS kind, NULL AS key, COUNT(*) AS n 
+    FROM scraped_posts
+    UNION ALL
+    SELECT 'platform', platform, COUNT(*) 
+    FROM scraped_posts 
+    GROUP BY platform
+    UNION ALL
+    SELECT 'subreddit', subreddit, n FROM (
+        SELECT subreddit, COUNT(*) AS n 
+        FROM scraped_posts 
+        WHERE platform = 'reddit' AND subreddit IS NOT NULL
+        GROUP BY subreddit 
+        ORDER BY n DESC 
+        LIMIT 10
+    ) top_subreddits
+    ORDER BY n DESC
+""")
+
+RECENT_SQL = text("""
+    SELECT 
+        platform,
+        author,
+        content,
+        score,
+        subreddit,
+        created_at,
+        scraped_at
+    FROM scraped_posts 
+    ORDER BY scraped_at DESC 
+    LIMIT :limit
+""").execution_options(stream_results=True)
+
+SEARCH_FTS_SQL = {
+    "sqlite": text("""
+        SELECT 
+            p.author,
+            p.content,
+            p.score,
+            p.subreddit,
+            p.url
+        FROM scraped_posts_fts f
+        JOIN scraped_posts p ON p.id = f.id
+        WHERE scraped_posts_fts MATCH :query 
+        ORDER BY p.score DESC 
+        LIMIT :limit
+    """).execution_options(stream_results=True),
+    "postgresql": text("""
+        SELECT 
+            author,
+            content,
+            score,
+            subreddit,
+            url
+        FROM scraped_posts 
+        WHERE to_tsvector('english', content) @@ plainto_tsquery('english', :query) 
+        ORDER BY score DESC 
+        LIMIT :limit
+    """).execution_options(stream_results=True),
+}
+
+SEARCH_LIKE_SQL = text("""
+    SELECT 
+        author,
+        content,
+        score,
+        subreddit,
+        url
+    FROM scraped_posts 
+    WHERE content LIKE :query 
+    ORDER BY score DESC 
+    LIMIT :limit
+""").execution_options(stream_results=True)
+
+# Have the database render timestamps as ISO strings so export rows go
+# straight into the JSON without building datetime objects
+EXPORT_DATE_FORMAT = {
+    "sqlite": "strftime('%Y-%m-%dT%H:%M:%S', {column})",
+    "postgresql": "to_char({column}, 'YYYY-MM-DD\"T\"HH24:MI:SS')",
+}.get(db_manager.engine.dialect.name, "{column}")
+
+EXPORT_SQL = text(f"""
+    SELECT 
+        platform,
+        author,
+        content,
+        score,
+        subreddit,
+        url,
+        {EXPORT_DATE_FORMAT.format(column="created_at")} AS created_at,
+        {EXPORT_DATE_FORMAT.format(column="scraped_at")} AS scraped_at
+    FROM scraped_posts 
+    ORDER BY scraped_posts.scraped_at DESC 
+    LIMIT :limit
+""").execution_options(stream_results=True)
+
 def show_database_stats():
     """Show database statistics."""
     print("📊 Database Statistics")
     print("=" * 50)
     
     with db_manager.get_session() as db:
-        # Count total posts
-        total_posts = db.execute(text("SELECT COUNT(*) FROM scraped_posts")).scalar()
-        print(f"Total Posts: {total_posts}")
+        # Total, per-platform and top-subreddit counts in one round trip,
+        # tagged by kind so they can be split apart again below
+        rows = db.execute(STATS_SQL).fetchall()
         
-        # Count by platform
-        platform_counts = db.execute(text("""
-            SELECT platform, COUNT(*) as count 
-            FROM scraped_posts 
-            GROUP BY platform
-        """)).fetchall()
+        total_posts = 0
+        platform_counts = []
+        subreddit_counts = []
+        for kind, key, count in rows:
+            if kind == 'total':
+                total_posts = count
+            elif kind == 'platform':
+                platform_counts.append((key, count))
+            else:
+                subreddit_counts.append((key, count))
+        
+        print(f"Total Posts: {total_posts}")
         
         print("\nPosts by Platform:")
         for platform, count in platform_counts:
             print(f"  - {platform}: {count}")
         
-        # Count by subreddit (for Reddit posts)
-        subreddit_counts = db.execute(text("""
-            SELECT subreddit, COUNT(*) as count 
-            FROM scraped_posts 
-            WHERE platform = 'reddit' AND subreddit IS NOT NULL
-            GROUP BY subreddit 
-            ORDER BY count DESC 
-            LIMIT 10
-        """)).fetchall()
-        
         print("\nTop Subreddits:")
         for subreddit, count in subreddit_counts:
             print(f"  - r/{subreddit}: {count}")
@@ -52,104 +153,89 @@ def show_recent_posts(limit=5):
     print("=" * 50)
     
     with db_manager.get_session() as db:
-        posts = db.execute(text("""
-            SELECT 
-                platform,
-                author,
-                content,
-                score,
-                subreddit,
-                created_at,
-                scraped_at
-            FROM scraped_posts 
-            ORDER BY scraped_at DESC 
-            LIMIT :limit
-        """), {"limit": limit}).fetchall()
+        posts = db.execute(RECENT_SQL, {"limit": limit}).yield_per(200)
+        
+        # Collect the output and write it once rather than print per line
+        lines = []
+        for i, (platform, author, content, score, subreddit, created_at, scraped_at) in enumerate(posts, 1):
+            lines.append(f"\n{i}. [{platform}] {content[:60]}...")
+            lines.append(f"   👤 Author: {author}")
+            if subreddit:
+                lines.append(f"   📍 Subreddit: r/{subreddit}")
+            lines.append(f"   📊 Score: {score}")
+            lines.append(f"   📅 Created: {created_at}")
+            lines.append(f"   🕐 Scraped: {scraped_at}")
         
-        for i, post in enumerate(posts, 1):
-            print(f"\n{i}. [{post.platform}] {post.content[:60]}...")
-            print(f"   👤 Author: {post.author}")
-            if post.subreddit:
-                print(f"   📍 Subreddit: r/{post.subreddit}")
-            print(f"   📊 Score: {post.score}")
-            print(f"   📅 Created: {post.created_at}")
-            print(f"   🕐 Scraped: {post.scraped_at}")
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
 
 def search_posts(query, limit=5):
     """Search posts in database."""
     print(f"\n🔍 Search Results for '{query}'")
     print("=" * 50)
     
+    dialect = db_manager.engine.dialect.name
+    
+    if db_manager.full_text_search and dialect == "sqlite":
+        # Quote each term so user input can't break FTS5 syntax; the
+        # trailing * keeps LIKE-style prefix matching
+        fts_query = " ".join('"' + term.replace('"', '""') + '"*' for term in query.split())
+        stmt = SEARCH_FTS_SQL["sqlite"]
+        params = {"query": fts_query, "limit": limit}
+    elif db_manager.full_text_search and dialect == "postgresql":
+        stmt = SEARCH_FTS_SQL["postgresql"]
+        params = {"query": query, "limit": limit}
+    else:
+        stmt = SEARCH_LIKE_SQL
+        params = {"query": f"%{query}%", "limit": limit}
+    
     with db_manager.get_session() as db:
-        posts = db.execute(text("""
-            SELECT 
-                platform,
-                author,
-                content,
-                score,
-                subreddit,
-                url
-            FROM scraped_posts 
-            WHERE content LIKE :query 
-            ORDER BY score DESC 
-            LIMIT :limit
-        """), {"query": f"%{query}%", "limit": limit}).fetchall()
+        posts = db.execute(stmt, params).yield_per(200)
         
-        if not posts:
-            print("No posts found matching your query.")
-            return
+        lines = []
+        for i, (author, content, score, subreddit, url) in enumerate(posts, 1):
+            lines.append(f"\n{i}. {content[:80]}...")
+            lines.append(f"   👤 Author: {author}")
+            if subreddit:
+                lines.append(f"   📍 Subreddit: r/{subreddit}")
+            lines.append(f"   📊 Score: {score}")
+            lines.append(f"   🔗 URL: {url}")
         
-        for i, post in enumerate(posts, 1):
-            print(f"\n{i}. {post.content[:80]}...")
-            print(f"   👤 Author: {post.author}")
-            if post.subreddit:
-                print(f"   📍 Subreddit: r/{post.subreddit}")
-            print(f"   📊 Score: {post.score}")
-            print(f"   🔗 URL: {post.url}")
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
+        else:
+            print("No posts found matching your query.")
 
 def export_to_json(filename="exported_posts.json", limit=100):
     """Export posts to JSON file."""
-    import json
-    from datetime import datetime
-    
     print(f"\n💾 Exporting {limit} posts to {filename}")
     print("=" * 50)
     
     with db_manager.get_session() as db:
-        posts = db.execute(text("""
-            SELECT 
-                platform,
-                author,
-                content,
-                score,
-                subreddit,
-                url,
-                created_at,
-                scraped_at
-            FROM scraped_posts 
-            ORDER BY scraped_at DESC 
-            LIMIT :limit
-        """), {"limit": limit}).fetchall()
-        
-        # Convert to list of dictionaries
-        posts_data = []
-        for post in posts:
-            posts_data.append({
-                "platform": post.platform,
-                "author": post.author,
-                "content": post.content,
-                "score": post.score,
-                "subreddit": post.subreddit,
-                "url": post.url,
-                "created_at": post.created_at.isoformat() if post.created_at else None,
-                "scraped_at": post.scraped_at.isoformat() if post.scraped_at else None
-            })
+        posts = db.execute(EXPORT_SQL, {"limit": limit}).yield_per(1000)
         
-        # Write to JSON file
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(posts_data, f, indent=2, ensure_ascii=False)
+        # Stream rows to the file one at a time instead of building a list
+        exported = 0
+        with open(filename, 'wb', buffering=1 << 20) as f:
+            f.write(b"[")
+            for platform, author, content, score, subreddit, url, created_at, scraped_at in posts:
+                if exported:
+                    f.write(b",")
+                f.write(b"\n  ")
+                f.write(orjson.dumps({
+                    "platform": platform,
+                    "author": author,
+                    "content": content,
+                    "score": score,
+                    "subreddit": subreddit,
+                    "url": url,
+                    "created_at": created_at,
+                    "scraped_at": scraped_at
+                }))
+                exported += 1
+            f.write(b"\n]\n")
         
-        print(f"✅ Exported {len(posts_data)} posts to {filename}")
+        print(f"✅ Exported {exported} posts to {filename}")
 
 def interactive_database_explorer():
     """Interactive database explorer."""
@@ -167,28 +253,12 @@ def interactive_database_explorer():
         try:
             command = input("\n> ").strip().lower()
             
-            if command == "quit" or command == "q":
+            if command in QUIT_COMMANDS:
                 break
-            elif command == "stats" or command == "1":
-                show_database_stats()
-            elif command == "recent" or command == "2":
-                limit = input("How many posts? (default 5): ").strip()
-                limit = int(limit) if limit.isdigit() else 5
-                show_recent_posts(limit)
-            elif command == "search" or command == "3":
-                query = input("Search query: ").strip()
-                if query:
-                    search_posts(query)
-            elif command == "export" or command == "4":
-                filename = input("Filename (default: exported_posts.json): ").strip()
-                filename = filename if filename else "exported_posts.json"
-                limit = input("How many posts? (default 100): ").strip()
-                limit = int(limit) if limit.isdigit() else 100
-                export_to_json(filename, limit)
-            elif command == "sql" or command == "5":
-                query = input("SQL query: ").strip()
-                if query:
-                    execute_custom_query(query)
+            
+            handler = DISPATCH.get(command)
+            if handler:
+                handler()
             else:
                 print("Unknown command. Type 'quit' to exit.")
                 
@@ -213,9 +283,10 @@ def execute_custom_query(query):
                         print(" | ".join(headers))
                         print("-" * (len(" | ".join(headers))))
                     
-                    # Print rows
-                    for row in rows[:20]:  # Limit to 20 rows
-                        print(" | ".join(str(col) for col in row))
+                    # Print rows in one write rather than a print per row
+                    sys.stdout.write(
+                        "".join(" | ".join(map(str, row)) + "\n" for row in rows[:20])  # Limit to 20 rows
+                    )
                     
                     if len(rows) > 20:
                         print(f"... and {len(rows) - 20} more rows")
@@ -227,6 +298,45 @@ def execute_custom_query(query):
     except Exception as e:
         print(f"❌ SQL Error: {e}")
 
+def _ask_int(prompt, default):
+    """Prompt for a positive integer, falling back to a default."""
+    value = input(prompt).strip()
+    return int(value) if value.isdigit() else default
+
+def _recent_command():
+    show_recent_posts(_ask_int("How many posts? (default 5): ", 5))
+
+def _search_command():
+    query = input("Search query: ").strip()
+    if query:
+        search_posts(query)
+
+def _export_command():
+    filename = input("Filename (default: exported_posts.json): ").strip()
+    filename = filename if filename else "exported_posts.json"
+    export_to_json(filename, _ask_int("How many posts? (default 100): ", 100))
+
+def _sql_command():
+    query = input("SQL query: ").strip()
+    if query:
+        execute_custom_query(query)
+
+# Explorer commands by name and menu number
+DISPATCH = {
+    "stats": show_database_stats,
+    "1": show_database_stats,
+    "recent": _recent_command,
+    "2": _recent_command,
+    "search": _search_command,
+    "3": _search_command,
+    "export": _export_command,
+    "4": _export_command,
+    "sql": _sql_command,
+    "5": _sql_command,
+}
+
+QUIT_COMMANDS = {"quit", "q", "6"}
+
 if __name__ == "__main__":
     print("🗄️ Database Access Tool")
     print("=" * 50)
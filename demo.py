@@ -10,10 +10,25 @@ from datetime import datetime
 # Add src directory to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
+from src.scrapers.base import post_to_row
 from src.scrapers.reddit_scraper import RedditScraper
 from src.models import Platform
 from src.database import db_manager
 
+# Number of posts buffered before flushing a bulk insert
+BATCH_SIZE = 500
+
+
+def flush_batch(batch):
+    """Bulk insert buffered post dicts and empty the buffer."""
+    saved = 0
+    try:
+        saved = db_manager.save_posts_bulk(batch)
+    except Exception as e:
+        print(f"   ❌ Error saving: {e}")
+    batch.clear()
+    return saved
+
 async def demo_reddit_scraper():
     """Demo Reddit scraping functionality."""
     print("🚀 Starting Reddit Scraper Demo")
@@ -34,6 +49,8 @@ async def demo_reddit_scraper():
             print("📋 Scraping posts from r/python (limit: 5)...")
             
             posts_scraped = 0
+            posts_saved = 0
+            batch = []
             async for post in scraper.scrape_posts("python", max_posts=5):
                 posts_scraped += 1
                 print(f"\n📝 Post {posts_scraped}:")
@@ -43,18 +60,20 @@ async def demo_reddit_scraper():
                 print(f"   URL: {post.url}")
                 print(f"   Created: {post.created_at}")
                 
-                # Save to database
-                try:
-                    db_manager.save_post(post.dict())
-                    print("   ✅ Saved to database")
-                except Exception as e:
-                    print(f"   ❌ Error saving: {e}")
+                # Queue for a bulk save
+                batch.append(post_to_row(post))
+                if len(batch) >= BATCH_SIZE:
+                    posts_saved += flush_batch(batch)
                 
                 # Break after a few posts for demo
                 if posts_scraped >= 3:
                     break
                     
+            if batch:
+                posts_saved += flush_batch(batch)
+                    
             print(f"\n🎉 Successfully scraped {posts_scraped} posts from Reddit!")
+            print(f"💾 Saved {posts_saved} posts to database")
             
         except Exception as e:
             print(f"❌ Error during scraping: {e}")
@@ -68,9 +87,15 @@ async def demo_reddit_scraper():
     print(f"\n📊 Database Statistics:")
     try:
         with db_manager.get_session() as db:
-            from src.database import ScrapedPostDB
-            total_posts = db.query(ScrapedPostDB).count()
-            reddit_posts = db.query(ScrapedPostDB).filter(ScrapedPostDB.platform == "reddit").count()
+            # Scalar counts only, so go straight to the DBAPI cursor
+            cursor = db.connection().connection.cursor()
+            try:
+                cursor.execute("SELECT platform, COUNT(*) FROM scraped_posts GROUP BY platform")
+                platform_counts = dict(cursor.fetchall())
+            finally:
+                cursor.close()
+            total_posts = sum(platform_counts.values())
+            reddit_posts = platform_counts.get("reddit", 0)
             print(f"   Total posts in database: {total_posts}")
             print(f"   Reddit posts: {reddit_posts}")
     except Exception as e:
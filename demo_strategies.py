@@ -4,9 +4,13 @@ Enhanced Web Scraper Example Usage - Multiple Strategies
 """
 import asyncio
 from src.scrapers.manager import EnhancedScraperManager
+from src.scrapers.base import post_to_row
 from src.models import Platform, ScrapingStrategy
 from src.database import db_manager
 
+# Upper bound on strategies scraping at the same time
+MAX_CONCURRENT_STRATEGIES = 4
+
 async def demo_reddit_strategies():
     """Demonstrate different Reddit scraping strategies."""
     print("🚀 Enhanced Web Scraper - Strategy Demo")
@@ -32,42 +36,58 @@ async def demo_reddit_strategies():
         
         strategies_to_test = await manager.get_available_strategies(Platform.REDDIT)
         
-        for strategy in strategies_to_test:
-            print(f"\n🔄 Testing {strategy.value} strategy...")
-            
-            try:
+        # Strategies are independent, so run them side by side
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_STRATEGIES)
+        
+        async def run_strategy(strategy):
+            async with semaphore:
                 posts = await manager.scrape_with_fallback(
                     platform=Platform.REDDIT,
                     target=test_subreddit,
                     max_posts=test_posts,
                     preferred_strategy=strategy
                 )
+                return strategy, posts
+        
+        print(f"\n🔄 Testing {len(strategies_to_test)} strategies concurrently...")
+        results = await asyncio.gather(
+            *(run_strategy(strategy) for strategy in strategies_to_test),
+            return_exceptions=True
+        )
+        
+        all_posts = []
+        for strategy, result in zip(strategies_to_test, results):
+            print(f"\n🔄 {strategy.value} strategy:")
+            
+            if isinstance(result, Exception):
+                print(f"  ❌ Failed: {result}")
+                continue
                 
-                if posts:
-                    print(f"  ✅ Success! Got {len(posts)} posts")
-                    
-                    # Show first post as example
-                    sample = posts[0]
-                    print(f"  📝 Sample: {sample.content[:60]}...")
-                    print(f"  👤 Author: u/{sample.author}")
-                    print(f"  📊 Score: {sample.score}")
-                    
-                    # Save to database
-                    saved_count = 0
-                    for post in posts:
-                        try:
-                            db_manager.save_post(post.dict())
-                            saved_count += 1
-                        except Exception as e:
-                            print(f"  ⚠️ Error saving post: {e}")
-                    
-                    print(f"  💾 Saved {saved_count} posts to database")
-                    
-                else:
-                    print(f"  ⚠️ No posts returned")
-                    
+            _, posts = result
+            if posts:
+                print(f"  ✅ Success! Got {len(posts)} posts")
+                
+                # Show first post as example
+                sample = posts[0]
+                print(f"  📝 Sample: {sample.content[:60]}...")
+                print(f"  👤 Author: u/{sample.author}")
+                print(f"  📊 Score: {sample.score}")
+                
+                all_posts.extend(posts)
+            else:
+                print(f"  ⚠️ No posts returned")
+        
+        # Save every strategy's posts in one bulk insert; strategies return
+        # the same Reddit post ids, so keep one copy of each
+        unique_posts = {post.id: post for post in all_posts}
+        if unique_posts:
+            saved_count = 0
+            try:
+                saved_count = db_manager.save_posts_bulk([post_to_row(post) for post in unique_posts.values()])
             except Exception as e:
-                print(f"  ❌ Failed: {e}")
+                print(f"\n⚠️ Error saving posts: {e}")
+            
+            print(f"\n💾 Saved {saved_count} posts to database")
         
         # Demonstrate fallback behavior
         print(f"\n🔄 Testing automatic fallback...")
@@ -10,6 +10,47 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from src.database import db_manager
 from sqlalchemy import text
 
+# All five report sections in one round trip. Each row is tagged with its
+# section; the unused columns of a section are NULL, cast where needed so
+# PostgreSQL can line the branch types up.
+QUICK_SQL = text("""
+    SELECT 'total' AS kind, NULL AS author, NULL AS content, NULL AS subreddit,
+           COUNT(*) AS n, CAST(NULL AS TIMESTAMP) AS scraped_at
+    FROM scraped_posts
+    UNION ALL
+    SELECT * FROM (
+        SELECT 'subreddit', NULL, NULL, subreddit, COUNT(*) AS n, CAST(NULL AS TIMESTAMP)
+        FROM scraped_posts 
+        WHERE subreddit IS NOT NULL 
+        GROUP BY subreddit 
+        ORDER BY n DESC 
+        LIMIT 5
+    ) subreddits
+    UNION ALL
+    SELECT * FROM (
+        SELECT 'top', author, content, subreddit, score, CAST(NULL AS TIMESTAMP)
+        FROM scraped_posts 
+        ORDER BY score DESC 
+        LIMIT 3
+    ) top_posts
+    UNION ALL
+    SELECT * FROM (
+        SELECT 'recent', author, content, NULL, CAST(NULL AS INTEGER), scraped_at
+        FROM scraped_posts 
+        ORDER BY scraped_at DESC 
+        LIMIT 3
+    ) recent
+    UNION ALL
+    SELECT * FROM (
+        SELECT 'author', author, NULL, NULL, COUNT(*) AS n, CAST(NULL AS TIMESTAMP)
+        FROM scraped_posts 
+        GROUP BY author 
+        ORDER BY n DESC 
+        LIMIT 5
+    ) authors
+    ORDER BY kind, n DESC, scraped_at DESC
+""")
+
 def quick_queries():
     """Run some quick database queries."""
     
@@ -17,63 +58,37 @@ def quick_queries():
     print("=" * 50)
     
     with db_manager.get_session() as db:
-        
-        # 1. Total posts count
-        total = db.execute(text("SELECT COUNT(*) FROM scraped_posts")).scalar()
-        print(f"📊 Total Posts: {total}")
-        
-        # 2. Posts by subreddit
-        print(f"\n📍 Posts by Subreddit:")
-        subreddits = db.execute(text("""
-            SELECT subreddit, COUNT(*) as count 
-            FROM scraped_posts 
-            WHERE subreddit IS NOT NULL 
-            GROUP BY subreddit 
-            ORDER BY count DESC 
-            LIMIT 5
-        """)).fetchall()
-        
-        for subreddit, count in subreddits:
-            print(f"   r/{subreddit}: {count} posts")
-        
-        # 3. Top scoring posts
-        print(f"\n🏆 Top Scoring Posts:")
-        top_posts = db.execute(text("""
-            SELECT author, content, score, subreddit 
-            FROM scraped_posts 
-            ORDER BY score DESC 
-            LIMIT 3
-        """)).fetchall()
-        
-        for i, (author, content, score, subreddit) in enumerate(top_posts, 1):
-            print(f"   {i}. {content[:60]}...")
-            print(f"      👤 u/{author} | 📊 {score} | 📍 r/{subreddit}")
-        
-        # 4. Recent activity
-        print(f"\n⏰ Recent Activity:")
-        recent = db.execute(text("""
-            SELECT author, content, scraped_at 
-            FROM scraped_posts 
-            ORDER BY scraped_at DESC 
-            LIMIT 3
-        """)).fetchall()
-        
-        for author, content, scraped_at in recent:
-            print(f"   📝 {content[:50]}...")
-            print(f"      👤 u/{author} | 🕐 {scraped_at}")
-        
-        # 5. Authors with most posts
-        print(f"\n👥 Most Active Authors:")
-        authors = db.execute(text("""
-            SELECT author, COUNT(*) as post_count 
-            FROM scraped_posts 
-            GROUP BY author 
-            ORDER BY post_count DESC 
-            LIMIT 5
-        """)).fetchall()
-        
-        for author, count in authors:
-            print(f"   u/{author}: {count} posts")
+        rows = db.execute(QUICK_SQL).fetchall()
+    
+    sections = {"total": [], "subreddit": [], "top": [], "recent": [], "author": []}
+    for kind, *columns in rows:
+        sections[kind].append(columns)
+    
+    # 1. Total posts count
+    total = sections["total"][0][3] if sections["total"] else 0
+    print(f"📊 Total Posts: {total}")
+    
+    # 2. Posts by subreddit
+    print(f"\n📍 Posts by Subreddit:")
+    for _, _, subreddit, count, _ in sections["subreddit"]:
+        print(f"   r/{subreddit}: {count} posts")
+    
+    # 3. Top scoring posts
+    print(f"\n🏆 Top Scoring Posts:")
+    for i, (author, content, subreddit, score, _) in enumerate(sections["top"], 1):
+        print(f"   {i}. {content[:60]}...")
+        print(f"      👤 u/{author} | 📊 {score} | 📍 r/{subreddit}")
+    
+    # 4. Recent activity
+    print(f"\n⏰ Recent Activity:")
+    for author, content, _, _, scraped_at in sections["recent"]:
+        print(f"   📝 {content[:50]}...")
+        print(f"      👤 u/{author} | 🕐 {scraped_at}")
+    
+    # 5. Authors with most posts
+    print(f"\n👥 Most Active Authors:")
+    for author, _, _, count, _ in sections["author"]:
+        print(f"   u/{author}: {count} posts")
 
 if __name__ == "__main__":
     quick_queries()
@@ -2,22 +2,82 @@
 Command Line Interface for the web scraper.
 """
 import asyncio
-import json
+import csv
+import itertools
+import re
+import sys
 from typing import Optional, List
+import orjson
 import typer
 from rich.console import Console
-from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.panel import Panel
 from rich import print as rprint
 
 from .models import Platform, ScrapingStrategy
-from .database import db_manager
-from .scrapers.manager import scraper_manager
+from .database import db_manager, POST_EXPORT_COLUMNS
+
+# Drive every command's asyncio.run() with uvloop when it is installed
+if sys.platform != "win32":
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
 
 app = typer.Typer(help="🕷️ Web Scraper for Reddit and Twitter/X")
 console = Console()
 
+# Icons shown before a job's status in list-jobs
+_JOB_STATUS_PREFIX = {"active": "🔄 ", "success": "✅ ", "failed": "❌ "}
+
+# Input validation patterns, compiled once
+_SUBREDDIT_RE = re.compile(r"^[A-Za-z0-9_]{1,21}$")
+_KEYWORD_RE = re.compile(r"[^,\s](?:[^,]*[^,\s])?")  # comma-separated, trimmed
+
+
+def _trunc(text: str, width: int) -> str:
+    """Cut text to width characters, marking the cut with an ellipsis."""
+    return text if len(text) <= width else f"{text[:width]}..."
+
+
+class _NullProgress:
+    """Stand-in for a Rich Progress when output is not a terminal."""
+    
+    def __enter__(self):
+        return self
+        
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+        
+    def add_task(self, *args, **kwargs):
+        return 0
+        
+    def update(self, *args, **kwargs):
+        pass
+        
+    def stop(self):
+        pass
+
+
+def _make_progress():
+    """Return a spinner on a terminal, or a no-op when output is piped."""
+    if not console.is_terminal:
+        return _NullProgress()
+        
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+        transient=True,
+    )
+
+
+def _write_plain(headers, rows):
+    """Write rows to stdout as tab-separated values, bypassing Rich."""
+    writer = csv.writer(sys.stdout, dialect='excel-tab')
+    writer.writerow(headers)
+    writer.writerows(rows)
+
 
 @app.command()
 def setup():
@@ -34,61 +94,47 @@ def setup():
 def scrape_reddit(
     subreddit: str = typer.Argument(..., help="Subreddit name (without r/)"),
     max_posts: int = typer.Option(100, "--max-posts", "-n", help="Maximum number of posts to scrape"),
-    strategy: str = typer.Option("web", "--strategy", "-s", help="Scraping strategy: api/web/feed/browser"),
+    strategy: ScrapingStrategy = typer.Option(ScrapingStrategy.WEB, "--strategy", "-s", case_sensitive=False, help="Scraping strategy"),
     include_comments: bool = typer.Option(False, "--comments", "-c", help="Include comments"),
     keywords: Optional[str] = typer.Option(None, "--keywords", "-k", help="Comma-separated keywords to filter by"),
     wait: bool = typer.Option(False, "--wait", "-w", help="Wait for job completion")
 ):
     """Scrape posts from a Reddit subreddit with configurable strategy."""
+    if not _SUBREDDIT_RE.match(subreddit):
+        rprint(f"❌ [red]Invalid subreddit name: {subreddit}[/red]")
+        raise typer.Exit(1)
     
     async def run_scrape():
-        # Validate strategy
-        try:
-            strategy_enum = ScrapingStrategy(strategy.lower())
-        except ValueError:
-            rprint(f"❌ [red]Invalid strategy: {strategy}. Use: api, web, feed, or browser[/red]")
-            return
-            
-        keyword_list = keywords.split(",") if keywords else None
+        from .scrapers.manager import scraper_manager
+        
+        keyword_list = _KEYWORD_RE.findall(keywords) if keywords else None
         
         async with scraper_manager:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console,
-            ) as progress:
-                task = progress.add_task(f"Scraping r/{subreddit} with {strategy} strategy...", total=None)
+            with _make_progress() as progress:
+                task = progress.add_task(f"Scraping r/{subreddit} with {strategy.value} strategy...", total=None)
                 
                 try:
-                    posts = await scraper_manager.scrape_with_fallback(
+                    # Posts are saved in the background while scraping continues
+                    posts, posts_saved = await scraper_manager.scrape_and_save_with_fallback(
                         platform=Platform.REDDIT,
                         target=subreddit,
                         max_posts=max_posts,
-                        preferred_strategy=strategy_enum
+                        preferred_strategy=strategy
                     )
                     
-                    progress.update(task, description="Saving posts to database...")
-                    
-                    # Save posts to database
-                    posts_saved = 0
-                    for post in posts:
-                        try:
-                            db_manager.save_post(post.model_dump())
-                            posts_saved += 1
-                        except Exception as e:
-                            rprint(f"⚠️ [yellow]Error saving post {post.id}: {e}[/yellow]")
-                    
                     progress.update(task, description="Complete!")
                     
                     rprint(f"✅ [green]Successfully scraped {len(posts)} posts from r/{subreddit}![/green]")
                     rprint(f"💾 [blue]Saved {posts_saved} posts to database[/blue]")
-                    rprint(f"� [cyan]Strategy used: {strategy}[/cyan]")
+                    rprint(f"� [cyan]Strategy used: {strategy.value}[/cyan]")
                     
                     # Show sample posts
                     if posts:
                         rprint("\n📝 [bold]Sample posts:[/bold]")
-                        for i, post in enumerate(posts[:3]):
-                            rprint(f"  {i+1}. {post.content[:100]}..." if len(post.content) > 100 else f"  {i+1}. {post.content}")
+                        # Scraped text is printed verbatim, not parsed as markup
+                        console.print("\n".join(
+                            f"  {i+1}. {_trunc(post.content, 100)}" for i, post in enumerate(posts[:3])
+                        ), markup=False, highlight=False)
                     
                 except Exception as e:
                     rprint(f"❌ [red]Scraping failed: {e}[/red]")
@@ -107,16 +153,15 @@ def scrape_twitter(
     """Scrape posts from Twitter/X."""
     
     async def run_scrape():
-        keyword_list = keywords.split(",") if keywords else None
+        from .scrapers.manager import scraper_manager
+        
+        keyword_list = _KEYWORD_RE.findall(keywords) if keywords else None
         
         async with scraper_manager:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console,
-            ) as progress:
-                task = progress.add_task(f"Creating job for {target}...", total=None)
+            with _make_progress() as progress:
+                task = progress.add_task(f"Creating and starting job for {target}...", total=None)
                 
+                # create_job starts the job with strategy fallback
                 job_id = await scraper_manager.create_job(
                     platform=Platform.TWITTER,
                     target=target,
@@ -125,18 +170,14 @@ def scrape_twitter(
                     keywords=keyword_list
                 )
                 
-                progress.update(task, description=f"Starting scraping job {job_id}...")
-                await scraper_manager.start_job(job_id)
-                
                 rprint(f"✅ [green]Started Twitter scraping job: {job_id}[/green]")
                 
                 if wait:
                     progress.update(task, description="Waiting for job completion...")
-                    while True:
-                        status = await scraper_manager.get_job_status(job_id)
-                        if status and status['status'] in ['completed', 'failed', 'cancelled']:
-                            break
-                        await asyncio.sleep(2)
+                    status = await scraper_manager.wait_for_job(job_id)
+                    if not status:
+                        rprint(f"❌ [red]Job {job_id} not found[/red]")
+                        return
                     
                     progress.update(task, description="Job completed!")
                     
@@ -155,52 +196,68 @@ def scrape_twitter(
 
 
 @app.command()
-def list_jobs():
+def list_jobs(
+    plain: bool = typer.Option(False, "--plain", "-P", help="Print tab-separated rows instead of a table")
+):
     """List all scraping jobs."""
     
     async def run_list():
-        async with scraper_manager:
-            # Get active jobs
-            active_jobs = await scraper_manager.list_active_jobs()
-            
-            # Get all jobs from database
-            with db_manager.get_session() as db:
-                from .database import ScrapingJobDB
-                jobs = db.query(ScrapingJobDB).order_by(ScrapingJobDB.created_at.desc()).limit(20).all()
+        from .scrapers.manager import scraper_manager
+        
+        await scraper_manager.ensure_db()
+        
+        # Get active jobs as a set for the per-row membership test
+        active_jobs = frozenset(await scraper_manager.list_active_jobs())
+        
+        # Get all jobs from database
+        with db_manager.get_session() as db:
+            from .database import ScrapingJobDB
+            jobs = db.query(ScrapingJobDB).order_by(ScrapingJobDB.created_at.desc()).limit(20).all()
+        
+        if not jobs:
+            rprint("[yellow]No jobs found.[/yellow]")
+            return
             
-            if not jobs:
-                rprint("[yellow]No jobs found.[/yellow]")
-                return
+        # Format every cell up front, then hand the rows to the output
+        rows = []
+        for job in jobs:
+            if job.job_id in active_jobs:
+                state = "active"
+            elif job.success:
+                state = "success"
+            else:
+                state = job.status
                 
-            table = Table(title="Scraping Jobs")
-            table.add_column("Job ID", style="cyan", no_wrap=True)
-            table.add_column("Platform", style="magenta")
-            table.add_column("Target", style="green")
-            table.add_column("Status", style="yellow")
-            table.add_column("Posts", justify="right")
-            table.add_column("Comments", justify="right")
-            table.add_column("Created", style="blue")
-            
-            for job in jobs:
-                status = job.status
-                if job.job_id in active_jobs:
-                    status = f"🔄 {status}"
-                elif job.success:
-                    status = f"✅ {status}"
-                elif job.status == "failed":
-                    status = f"❌ {status}"
-                    
-                table.add_row(
-                    job.job_id[:8] + "...",
-                    job.platform,
-                    job.target[:20] + "..." if len(job.target) > 20 else job.target,
-                    status,
-                    str(job.posts_scraped),
-                    str(job.comments_scraped),
-                    job.created_at.strftime("%m/%d %H:%M")
-                )
-            
-            console.print(table)
+            rows.append((
+                job.job_id[:8] + "...",
+                job.platform,
+                _trunc(job.target, 20),
+                _JOB_STATUS_PREFIX.get(state, "") + job.status,
+                str(job.posts_scraped),
+                str(job.comments_scraped),
+                job.created_at.strftime("%m/%d %H:%M")
+            ))
+        
+        headers = ("Job ID", "Platform", "Target", "Status", "Posts", "Comments", "Created")
+        if plain:
+            _write_plain(headers, rows)
+            return
+        
+        from rich.table import Table
+        
+        table = Table(title="Scraping Jobs")
+        table.add_column("Job ID", style="cyan", no_wrap=True)
+        table.add_column("Platform", style="magenta")
+        table.add_column("Target", style="green")
+        table.add_column("Status", style="yellow")
+        table.add_column("Posts", justify="right")
+        table.add_column("Comments", justify="right")
+        table.add_column("Created", style="blue")
+        
+        for row in rows:
+            table.add_row(*row)
+        
+        console.print(table)
     
     asyncio.run(run_list())
 
@@ -212,15 +269,19 @@ def job_status(
     """Get detailed status of a specific job."""
     
     async def run_status():
-        async with scraper_manager:
-            status = await scraper_manager.get_job_status(job_id)
+        from rich.panel import Panel
+        from .scrapers.manager import scraper_manager
+        
+        await scraper_manager.ensure_db()
+        
+        status = await scraper_manager.get_job_status(job_id)
+        
+        if not status:
+            rprint(f"❌ [red]Job {job_id} not found[/red]")
+            return
             
-            if not status:
-                rprint(f"❌ [red]Job {job_id} not found[/red]")
-                return
-                
-            # Create status panel
-            status_text = f"""
+        # Create status panel
+        status_text = f"""
 [bold]Job ID:[/bold] {status['job_id']}
 [bold]Platform:[/bold] {status['platform']}
 [bold]Target:[/bold] {status['target']}
@@ -234,13 +295,13 @@ def job_status(
 [bold]Posts Scraped:[/bold] {status['posts_scraped']}
 [bold]Comments Scraped:[/bold] {status['comments_scraped']}
 [bold]Success:[/bold] {status['success']}
-            """
-            
-            console.print(Panel(status_text, title="Job Status", border_style="blue"))
-            
-            if status.get('errors'):
-                error_text = "\n".join(f"• {error}" for error in status['errors'][:10])
-                console.print(Panel(error_text, title="Errors", border_style="red"))
+        """
+        
+        console.print(Panel(status_text, title="Job Status", border_style="blue"))
+        
+        if status.get('errors'):
+            error_text = "\n".join(f"• {error}" for error in status['errors'][:10])
+            console.print(Panel(error_text, title="Errors", border_style="red"))
     
     asyncio.run(run_status())
 
@@ -252,6 +313,8 @@ def stop_job(
     """Stop a running job."""
     
     async def run_stop():
+        from .scrapers.manager import scraper_manager
+        
         async with scraper_manager:
             success = await scraper_manager.stop_job(job_id)
             
@@ -265,53 +328,59 @@ def stop_job(
 
 @app.command()
 def show_posts(
-    platform: Optional[str] = typer.Option(None, "--platform", "-p", help="Filter by platform (reddit/twitter)"),
+    platform: Optional[Platform] = typer.Option(None, "--platform", "-p", case_sensitive=False, help="Filter by platform"),
     author: Optional[str] = typer.Option(None, "--author", "-a", help="Filter by author"),
     subreddit: Optional[str] = typer.Option(None, "--subreddit", "-s", help="Filter by subreddit"),
-    limit: int = typer.Option(20, "--limit", "-l", help="Number of posts to show")
+    limit: int = typer.Option(20, "--limit", "-l", help="Number of posts to show"),
+    plain: bool = typer.Option(False, "--plain", "-P", help="Print tab-separated rows instead of a table")
 ):
     """Show scraped posts."""
     
     async def run_show():
-        platform_enum = None
-        if platform:
-            try:
-                platform_enum = Platform(platform.lower())
-            except ValueError:
-                rprint(f"❌ [red]Invalid platform: {platform}. Use 'reddit' or 'twitter'.[/red]")
-                return
+        from .scrapers.manager import scraper_manager
         
-        async with scraper_manager:
-            posts = await scraper_manager.get_scraped_posts(
-                platform=platform_enum,
-                limit=limit,
-                author=author,
-                subreddit=subreddit
-            )
-            
-            if not posts:
-                rprint("[yellow]No posts found.[/yellow]")
-                return
-                
-            table = Table(title=f"Scraped Posts ({len(posts)} results)")
-            table.add_column("Platform", style="magenta", width=8)
-            table.add_column("Author", style="cyan", width=15)
-            table.add_column("Content", style="white", width=50)
-            table.add_column("Score/Likes", justify="right", width=10)
-            table.add_column("Scraped", style="blue", width=12)
-            
-            for post in posts:
-                score_likes = str(post.get('score') or post.get('likes') or 0)
-                
-                table.add_row(
-                    post['platform'][:7],
-                    post['author'][:14],
-                    post['content'][:47] + "..." if len(post['content']) > 47 else post['content'],
-                    score_likes,
-                    post['scraped_at'].strftime("%m/%d %H:%M")
-                )
+        await scraper_manager.ensure_db()
+        
+        posts = await scraper_manager.get_scraped_posts(
+            platform=platform,
+            limit=limit,
+            author=author,
+            subreddit=subreddit
+        )
+        
+        if not posts:
+            rprint("[yellow]No posts found.[/yellow]")
+            return
             
-            console.print(table)
+        # Format every cell up front, then hand the rows to the output
+        rows = [
+            (
+                post['platform'][:7],
+                post['author'][:14],
+                _trunc(post['content'], 47),
+                str(post.get('score') or post.get('likes') or 0),
+                post['scraped_at'].strftime("%m/%d %H:%M")
+            )
+            for post in posts
+        ]
+        
+        if plain:
+            _write_plain(("Platform", "Author", "Content", "Score/Likes", "Scraped"), rows)
+            return
+        
+        from rich.table import Table
+        
+        table = Table(title=f"Scraped Posts ({len(posts)} results)")
+        table.add_column("Platform", style="magenta", width=8)
+        table.add_column("Author", style="cyan", width=15)
+        table.add_column("Content", style="white", width=50)
+        table.add_column("Score/Likes", justify="right", width=10)
+        table.add_column("Scraped", style="blue", width=12)
+        
+        for row in rows:
+            table.add_row(*row)
+        
+        console.print(table)
     
     asyncio.run(run_show())
 
@@ -321,12 +390,11 @@ def health():
     """Check health status of all scrapers."""
     
     async def run_health():
+        from rich.table import Table
+        from .scrapers.manager import scraper_manager
+        
         async with scraper_manager:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console,
-            ) as progress:
+            with _make_progress() as progress:
                 task = progress.add_task("Checking scraper health...", total=None)
                 
                 health_status = await scraper_manager.health_check()
@@ -351,6 +419,9 @@ def strategies():
     """Show available scraping strategies for each platform."""
     
     async def run_strategies():
+        from rich.table import Table
+        from .scrapers.manager import scraper_manager
+        
         async with scraper_manager:
             strategy_info = await scraper_manager.get_strategy_info()
             
@@ -386,46 +457,31 @@ def strategies():
 def search_reddit(
     query: str = typer.Argument(..., help="Search query"),
     max_posts: int = typer.Option(50, "--max-posts", "-n", help="Maximum number of posts to find"),
-    strategy: str = typer.Option("web", "--strategy", "-s", help="Scraping strategy: api/web/feed"),
+    strategy: ScrapingStrategy = typer.Option(ScrapingStrategy.WEB, "--strategy", "-s", case_sensitive=False, help="Scraping strategy"),
     subreddit: Optional[str] = typer.Option(None, "--subreddit", "-r", help="Limit search to specific subreddit")
 ):
     """Search Reddit posts with configurable strategy."""
+    if subreddit and not _SUBREDDIT_RE.match(subreddit):
+        rprint(f"❌ [red]Invalid subreddit name: {subreddit}[/red]")
+        raise typer.Exit(1)
     
     async def run_search():
-        try:
-            strategy_enum = ScrapingStrategy(strategy.lower())
-        except ValueError:
-            rprint(f"❌ [red]Invalid strategy: {strategy}. Use: api, web, or feed[/red]")
-            return
-            
+        from .scrapers.manager import scraper_manager
+        
         async with scraper_manager:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console,
-            ) as progress:
+            with _make_progress() as progress:
                 task = progress.add_task(f"Searching Reddit for '{query}'...", total=None)
                 
                 try:
-                    posts = await scraper_manager.scrape_search_with_fallback(
+                    # Results are saved in the background while the search continues
+                    posts, posts_saved = await scraper_manager.search_and_save_with_fallback(
                         platform=Platform.REDDIT,
                         query=query,
                         max_posts=max_posts,
-                        preferred_strategy=strategy_enum,
+                        preferred_strategy=strategy,
                         subreddit=subreddit
                     )
                     
-                    progress.update(task, description="Saving results...")
-                    
-                    # Save posts to database
-                    posts_saved = 0
-                    for post in posts:
-                        try:
-                            db_manager.save_post(post.model_dump())
-                            posts_saved += 1
-                        except Exception as e:
-                            rprint(f"⚠️ [yellow]Error saving post {post.id}: {e}[/yellow]")
-                    
                     progress.update(task, description="Complete!")
                     
                     rprint(f"✅ [green]Found {len(posts)} posts matching '{query}'![/green]")
@@ -434,10 +490,12 @@ def search_reddit(
                     # Show sample results
                     if posts:
                         rprint("\n🔍 [bold]Search results:[/bold]")
+                        lines = []
                         for i, post in enumerate(posts[:5]):
-                            content = post.content[:80] + "..." if len(post.content) > 80 else post.content
-                            rprint(f"  {i+1}. [r/{post.subreddit}] {content}")
-                            rprint(f"     👤 u/{post.author} | 👍 {post.score} | 💬 {post.replies}")
+                            lines.append(f"  {i+1}. [r/{post.subreddit}] {_trunc(post.content, 80)}")
+                            lines.append(f"     👤 u/{post.author} | 👍 {post.score} | 💬 {post.replies}")
+                        # Scraped text is printed verbatim, not parsed as markup
+                        console.print("\n".join(lines), markup=False, highlight=False)
                     
                 except Exception as e:
                     rprint(f"❌ [red]Search failed: {e}[/red]")
@@ -447,49 +505,40 @@ def search_reddit(
 
 @app.command()
 def test_strategy(
-    platform: str = typer.Argument(..., help="Platform to test (reddit/twitter)"),
-    strategy: str = typer.Argument(..., help="Strategy to test (api/web/feed/browser)"),
+    platform: Platform = typer.Argument(..., case_sensitive=False, help="Platform to test"),
+    strategy: ScrapingStrategy = typer.Argument(..., case_sensitive=False, help="Strategy to test"),
     target: str = typer.Option("python", "--target", "-t", help="Target to test with (subreddit, username, etc.)")
 ):
     """Test a specific scraping strategy."""
     
     async def run_test():
-        try:
-            platform_enum = Platform(platform.lower())
-            strategy_enum = ScrapingStrategy(strategy.lower())
-        except ValueError as e:
-            rprint(f"❌ [red]Invalid parameter: {e}[/red]")
-            return
-            
+        from .scrapers.manager import scraper_manager
+        
         async with scraper_manager:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console,
-            ) as progress:
-                task = progress.add_task(f"Testing {strategy} strategy for {platform}...", total=None)
+            with _make_progress() as progress:
+                task = progress.add_task(f"Testing {strategy.value} strategy for {platform.value}...", total=None)
                 
                 try:
                     # Check if strategy is available
-                    available_strategies = await scraper_manager.get_available_strategies(platform_enum)
+                    available_strategies = await scraper_manager.get_available_strategies(platform)
                     
-                    if strategy_enum not in available_strategies:
-                        rprint(f"❌ [red]Strategy '{strategy}' not available for {platform}[/red]")
+                    if strategy not in available_strategies:
+                        rprint(f"❌ [red]Strategy '{strategy.value}' not available for {platform.value}[/red]")
                         rprint(f"Available strategies: {[s.value for s in available_strategies]}")
                         return
                     
                     # Test with just 5 posts
                     posts = await scraper_manager.scrape_with_fallback(
-                        platform=platform_enum,
+                        platform=platform,
                         target=target,
                         max_posts=5,
-                        preferred_strategy=strategy_enum
+                        preferred_strategy=strategy
                     )
                     
                     progress.update(task, description="Test complete!")
                     
                     if posts:
-                        rprint(f"✅ [green]Strategy '{strategy}' working! Got {len(posts)} test posts[/green]")
+                        rprint(f"✅ [green]Strategy '{strategy.value}' working! Got {len(posts)} test posts[/green]")
                         
                         # Show first post as example
                         sample_post = posts[0]
@@ -499,10 +548,10 @@ def test_strategy(
                         rprint(f"  📊 Score: {sample_post.score}")
                         rprint(f"  📄 Content: {sample_post.content[:100]}...")
                     else:
-                        rprint(f"⚠️ [yellow]Strategy '{strategy}' available but returned no posts[/yellow]")
+                        rprint(f"⚠️ [yellow]Strategy '{strategy.value}' available but returned no posts[/yellow]")
                     
                 except Exception as e:
-                    rprint(f"❌ [red]Strategy '{strategy}' failed: {e}[/red]")
+                    rprint(f"❌ [red]Strategy '{strategy.value}' failed: {e}[/red]")
                     
     asyncio.run(run_test())
 
@@ -511,48 +560,54 @@ def test_strategy(
 def export(
     format: str = typer.Option("json", "--format", "-f", help="Export format (json, csv)"),
     output: str = typer.Option("scraped_data", "--output", "-o", help="Output filename (without extension)"),
-    platform: Optional[str] = typer.Option(None, "--platform", "-p", help="Filter by platform"),
+    platform: Optional[Platform] = typer.Option(None, "--platform", "-p", case_sensitive=False, help="Filter by platform"),
     limit: int = typer.Option(1000, "--limit", "-l", help="Maximum number of posts to export")
 ):
     """Export scraped data to file."""
     
     async def run_export():
-        platform_enum = None
-        if platform:
-            try:
-                platform_enum = Platform(platform.lower())
-            except ValueError:
-                rprint(f"❌ [red]Invalid platform: {platform}[/red]")
-                return
+        from .scrapers.manager import scraper_manager
         
-        async with scraper_manager:
-            posts = await scraper_manager.get_scraped_posts(
-                platform=platform_enum,
-                limit=limit
-            )
-            
-            if not posts:
-                rprint("[yellow]No posts to export.[/yellow]")
-                return
-            
-            filename = f"{output}.{format}"
+        await scraper_manager.ensure_db()
+        
+        export_format = format.lower()
+        if export_format not in ("json", "csv"):
+            rprint(f"❌ [red]Unsupported format: {format}[/red]")
+            return
+        
+        # Rows are streamed from the database straight into the file
+        posts = db_manager.iter_posts(
+            platform=platform.value if platform else None,
+            limit=limit
+        )
+        
+        first = next(posts, None)
+        if first is None:
+            rprint("[yellow]No posts to export.[/yellow]")
+            return
+        
+        filename = f"{output}.{format}"
+        exported = 0
+        
+        if export_format == "json":
+            with open(filename, 'wb') as f:
+                f.write(b"[")
+                for post in itertools.chain([first], posts):
+                    if exported:
+                        f.write(b",")
+                    f.write(b"\n  ")
+                    f.write(orjson.dumps(post))
+                    exported += 1
+                f.write(b"\n]\n")
+        else:
+            with open(filename, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=POST_EXPORT_COLUMNS)
+                writer.writeheader()
+                for post in itertools.chain([first], posts):
+                    writer.writerow(post)
+                    exported += 1
             
-            if format.lower() == "json":
-                with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(posts, f, indent=2, default=str)
-            elif format.lower() == "csv":
-                try:
-                    import pandas as pd
-                    df = pd.DataFrame(posts)
-                    df.to_csv(filename, index=False)
-                except ImportError:
-                    rprint(f"❌ [red]Pandas not installed. Install with: pip install pandas[/red]")
-                    return
-            else:
-                rprint(f"❌ [red]Unsupported format: {format}[/red]")
-                return
-                
-            rprint(f"✅ [green]Exported {len(posts)} posts to {filename}[/green]")
+        rprint(f"✅ [green]Exported {exported} posts to {filename}[/green]")
     
     asyncio.run(run_export())
 
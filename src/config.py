@@ -2,12 +2,10 @@
 Configuration management for the web scraper.
 """
 import os
+from functools import lru_cache
 from typing import Optional
 from pydantic_settings import BaseSettings
 from pydantic import Field
-from dotenv import load_dotenv
-
-load_dotenv()
 
 
 class Settings(BaseSettings):
@@ -28,13 +26,24 @@ class Settings(BaseSettings):
     # Database
     database_url: str = Field("sqlite:///./webscraper.db", env="DATABASE_URL")
     redis_url: str = Field("redis://localhost:6379/0", env="REDIS_URL")
+    database_pool_size: int = Field(10, env="DATABASE_POOL_SIZE")
+    database_max_overflow: int = Field(20, env="DATABASE_MAX_OVERFLOW")
+    database_pool_recycle: int = Field(1800, env="DATABASE_POOL_RECYCLE")
+    database_pool_timeout: int = Field(30, env="DATABASE_POOL_TIMEOUT")
+    insert_batch_size: int = Field(100, env="INSERT_BATCH_SIZE")
+    read_cache_ttl: float = Field(5.0, env="READ_CACHE_TTL")  # Seconds post listings are cached
+    job_status_cache_ttl: float = Field(1.0, env="JOB_STATUS_CACHE_TTL")  # Polled while jobs run
+    store_raw_data: bool = Field(False, env="STORE_RAW_DATA")  # Keep raw API payloads in raw_data
     
     # Scraping configuration
     max_concurrent_requests: int = Field(5, env="MAX_CONCURRENT_REQUESTS")  # Lower for web scraping
+    max_concurrent_jobs: int = Field(16, env="MAX_CONCURRENT_JOBS")  # Further jobs queue as pending
+    max_concurrent_feeds: int = Field(4, env="MAX_CONCURRENT_FEEDS")  # Feeds fetched at once by scrape_many
     request_delay: float = Field(2.0, env="REQUEST_DELAY")  # Higher delay for respectful scraping
     retry_attempts: int = Field(3, env="RETRY_ATTEMPTS")
     rate_limit_requests: int = Field(30, env="RATE_LIMIT_REQUESTS")  # More conservative
     rate_limit_window: int = Field(60, env="RATE_LIMIT_WINDOW")
+    scrape_cache_ttl: int = Field(300, env="SCRAPE_CACHE_TTL")  # Seconds to reuse a scrape result; 0 disables
     
     # Scraping strategies
     default_scraping_strategy: str = Field("web", env="DEFAULT_SCRAPING_STRATEGY")
@@ -57,5 +66,11 @@ class Settings(BaseSettings):
         case_sensitive = False
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build the settings once per process; .env is read via Config.env_file."""
+    return Settings()
+
+
 # Global settings instance
-settings = Settings()
+settings = get_settings()
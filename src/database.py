@@ -1,11 +1,20 @@
 """
 Database models and setup using SQLAlchemy.
 """
+import threading
 from datetime import datetime
-from typing import List, Dict, Any, Generator
-from sqlalchemy import create_engine, Column, String, Integer, DateTime, Boolean, Text, JSON
+from typing import List, Dict, Any, Callable, Generator, Hashable, Iterator, Optional
+from cachetools import TTLCache
+from sqlalchemy import create_engine, Column, String, Integer, DateTime, Boolean, Text, JSON, bindparam, select, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError, OperationalError
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import StaticPool
+from loguru import logger
+from tenacity import retry, retry_if_exception, stop_after_attempt
+import orjson
 import uuid
 
 from .config import settings
@@ -17,7 +26,7 @@ class ScrapedPostDB(Base):
     """Database model for scraped posts."""
     __tablename__ = "scraped_posts"
     
-    id = Column(String, primary_key=True, index=True)
+    id = Column(String, primary_key=True)
     platform = Column(String, nullable=False, index=True)
     post_type = Column(String, nullable=False)
     author = Column(String, nullable=False, index=True)
@@ -86,16 +95,146 @@ class ScrapingJobDB(Base):
     success = Column(Boolean, default=False)
 
 
+def _json_serializer(value: Any) -> str:
+    """Encode JSON column values with orjson."""
+    return orjson.dumps(value, default=str).decode()
+
+
+def _engine_options(url: str) -> Dict[str, Any]:
+    """Pick pooling and batching options suited to the configured database backend."""
+    # Rows per multi-VALUES INSERT when save_posts_bulk passes a list of rows
+    options: Dict[str, Any] = {
+        "insertmanyvalues_page_size": 10_000,
+        # Room for every statement shape the scrapers and CLI issue
+        "query_cache_size": 1200,
+        # hashtags/mentions/media_urls/raw_data go through these on every row
+        "json_serializer": _json_serializer,
+        "json_deserializer": orjson.loads,
+    }
+    
+    if not url.startswith("sqlite"):
+        options.update(
+            pool_size=settings.database_pool_size,
+            max_overflow=settings.database_max_overflow,
+            pool_timeout=settings.database_pool_timeout,
+            # No SELECT 1 per checkout; stale connections are recycled by age
+            # and a dropped one is retried by _retry_on_disconnect instead
+            pool_pre_ping=False,
+            pool_recycle=settings.database_pool_recycle,
+        )
+        if url.startswith(("postgresql://", "postgresql+psycopg2://", "postgres://")):
+            # Also batch executemany UPDATE/DELETE via psycopg2.extras.execute_batch
+            options.update(
+                executemany_mode="values_plus_batch",
+                executemany_batch_page_size=500,
+            )
+        return options
+    
+    # Sessions are handed across threads by the async scrapers
+    options["connect_args"] = {"check_same_thread": False}
+    if url in ("sqlite://", "sqlite:///:memory:"):
+        # An in-memory database only lives as long as its one connection
+        options["poolclass"] = StaticPool
+    return options
+
+
+# Retry once on a connection the server dropped; SQLAlchemy invalidates the
+# pool on disconnect errors, so the second attempt gets a fresh connection.
+# Other OperationalErrors ("database is locked", "no such table") are raised
+# as-is, and single-row inserts that a retry could repeat are not wrapped.
+_retry_on_disconnect = retry(
+    retry=retry_if_exception(
+        lambda e: isinstance(e, OperationalError) and e.connection_invalidated
+    ),
+    stop=stop_after_attempt(2),
+    reraise=True,
+)
+
+
 # Database engine and session setup
 engine = create_engine(
     settings.database_url,
     echo=False,  # Set to True for SQL debugging
-    pool_pre_ping=True,
-    pool_recycle=300,
+    **_engine_options(settings.database_url),
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Hot lookups built once and reused with bound parameters
+POSTS_BY_PLATFORM_SQL = (
+    select(ScrapedPostDB)
+    .where(ScrapedPostDB.platform == bindparam("platform"))
+    .order_by(ScrapedPostDB.scraped_at.desc())
+    .limit(bindparam("limit"))
+)
+
+JOB_BY_ID_SQL = select(ScrapingJobDB).where(ScrapingJobDB.job_id == bindparam("job_id"))
+
+# Columns written out by the CLI export, in file order
+POST_EXPORT_COLUMNS = [
+    "id", "platform", "post_type", "author", "content", "url",
+    "created_at", "scraped_at", "score", "likes", "retweets", "replies",
+    "subreddit", "hashtags", "mentions",
+]
+
+# Indexes that let prefix LIKE predicates (e.g. subreddit LIKE 'py%') use an
+# index range scan. PostgreSQL needs text_pattern_ops under non-C locales;
+# SQLite's default LIKE is case-insensitive, so it needs NOCASE indexes.
+SQLITE_PATTERN_INDEX_DDL = [
+    "CREATE INDEX IF NOT EXISTS ix_scraped_posts_subreddit_nocase ON scraped_posts (subreddit COLLATE NOCASE)",
+    "CREATE INDEX IF NOT EXISTS ix_scraped_posts_author_nocase ON scraped_posts (author COLLATE NOCASE)",
+]
+
+POSTGRES_PATTERN_INDEX_DDL = [
+    "CREATE INDEX IF NOT EXISTS ix_scraped_posts_subreddit_pattern ON scraped_posts (subreddit text_pattern_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_scraped_posts_author_pattern ON scraped_posts (author text_pattern_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_scraped_posts_platform_pattern ON scraped_posts (platform text_pattern_ops)",
+]
+
+# Indexes that let the top-N views (ORDER BY score DESC LIMIT n) walk the
+# index in order instead of sorting the whole table. scraped_at already
+# has a single-column index, which serves ORDER BY scraped_at DESC as well;
+# the composite ones cover the same ordering once filtered by platform or
+# subreddit (get_posts_by_platform, iter_posts, per-subreddit views).
+SORT_INDEX_DDL = [
+    "CREATE INDEX IF NOT EXISTS ix_scraped_posts_score ON scraped_posts (score DESC)",
+    "CREATE INDEX IF NOT EXISTS ix_scraped_posts_platform_score ON scraped_posts (platform, score DESC)",
+    "CREATE INDEX IF NOT EXISTS ix_scraped_posts_platform_scraped_at ON scraped_posts (platform, scraped_at DESC)",
+    "CREATE INDEX IF NOT EXISTS ix_scraped_posts_subreddit_scraped_at ON scraped_posts (subreddit, scraped_at DESC)",
+]
+
+# Serves the finished-job cleanup (status IN (...) AND completed_at < cutoff)
+JOB_INDEX_DDL = [
+    "CREATE INDEX IF NOT EXISTS ix_scraping_jobs_status_completed_at ON scraping_jobs (status, completed_at)",
+]
+
+# Indexes that duplicate another one and only cost writes. The primary key
+# already has its own unique index, so a separate one on id is dead weight.
+REDUNDANT_INDEX_DDL = [
+    "DROP INDEX IF EXISTS ix_scraped_posts_id",
+]
+
+# Full-text index over post content. SQLite keeps a standalone FTS5 table in
+# sync through triggers; PostgreSQL indexes the tsvector expression directly.
+SQLITE_FTS_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS scraped_posts_fts USING fts5(id UNINDEXED, content)",
+    """CREATE TRIGGER IF NOT EXISTS scraped_posts_fts_ai AFTER INSERT ON scraped_posts BEGIN
+        INSERT INTO scraped_posts_fts (id, content) VALUES (new.id, new.content);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS scraped_posts_fts_ad AFTER DELETE ON scraped_posts BEGIN
+        DELETE FROM scraped_posts_fts WHERE id = old.id;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS scraped_posts_fts_au AFTER UPDATE OF id, content ON scraped_posts BEGIN
+        DELETE FROM scraped_posts_fts WHERE id = old.id;
+        INSERT INTO scraped_posts_fts (id, content) VALUES (new.id, new.content);
+    END""",
+]
+
+POSTGRES_FTS_DDL = [
+    "CREATE INDEX IF NOT EXISTS ix_scraped_posts_content_fts "
+    "ON scraped_posts USING gin (to_tsvector('english', content))",
+]
+
 
 def create_tables():
     """Create all database tables."""
@@ -116,10 +255,126 @@ class DatabaseManager:
     
     def __init__(self):
         self.engine = engine
+        self.full_text_search = False
+        self._tables_created = False
+        self._schema_lock = threading.Lock()
+        self._insert_ignore = self._build_insert_ignore()
+        
+        # Short-lived read caches for polled lookups, cleared on writes;
+        # DB calls arrive from worker threads, hence the lock
+        self._cache_lock = threading.Lock()
+        self._posts_cache = TTLCache(maxsize=1024, ttl=settings.read_cache_ttl)
+        self._job_cache = TTLCache(maxsize=1024, ttl=settings.job_status_cache_ttl)
         
     def create_tables(self):
         """Create all database tables."""
-        Base.metadata.create_all(bind=self.engine)
+        # Entry points call this freely; only the first call per process
+        # needs to check the schema
+        if self._tables_created:
+            return
+        
+        # Callers on worker threads may race here; one of them builds the schema
+        with self._schema_lock:
+            if self._tables_created:
+                return
+                
+            Base.metadata.create_all(bind=self.engine)
+            self._create_pattern_indexes()
+            self._create_sort_indexes()
+            self._create_job_indexes()
+            self._drop_redundant_indexes()
+            self._create_search_index()
+            self._tables_created = True
+
+    def _create_pattern_indexes(self):
+        """Create indexes that serve prefix LIKE lookups on text columns."""
+        statements = {
+            "sqlite": SQLITE_PATTERN_INDEX_DDL,
+            "postgresql": POSTGRES_PATTERN_INDEX_DDL,
+        }.get(self.engine.dialect.name, [])
+        
+        with self.engine.begin() as conn:
+            for ddl in statements:
+                conn.execute(text(ddl))
+
+    def _create_sort_indexes(self):
+        """Create indexes that serve the score- and recency-ordered top-N queries."""
+        with self.engine.begin() as conn:
+            for ddl in SORT_INDEX_DDL:
+                conn.execute(text(ddl))
+
+    def _create_job_indexes(self):
+        """Create indexes that serve scraping job maintenance queries."""
+        with self.engine.begin() as conn:
+            for ddl in JOB_INDEX_DDL:
+                conn.execute(text(ddl))
+
+    def _drop_redundant_indexes(self):
+        """Drop indexes left by older schemas that another index already covers."""
+        with self.engine.begin() as conn:
+            for ddl in REDUNDANT_INDEX_DDL:
+                conn.execute(text(ddl))
+
+    def _create_search_index(self):
+        """Create the full-text index used for post content search."""
+        dialect = self.engine.dialect.name
+
+        try:
+            with self.engine.begin() as conn:
+                if dialect == "sqlite":
+                    exists = conn.execute(text(
+                        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'scraped_posts_fts'"
+                    )).first()
+                    for ddl in SQLITE_FTS_DDL:
+                        conn.execute(text(ddl))
+                    if not exists:
+                        # Backfill posts saved before the index existed
+                        conn.execute(text(
+                            "INSERT INTO scraped_posts_fts (id, content) SELECT id, content FROM scraped_posts"
+                        ))
+                elif dialect == "postgresql":
+                    for ddl in POSTGRES_FTS_DDL:
+                        conn.execute(text(ddl))
+                else:
+                    return
+            self.full_text_search = True
+        except OperationalError as e:
+            logger.warning(f"Full-text search unavailable, falling back to LIKE: {e}")
+        
+    def _build_insert_ignore(self):
+        """Build an INSERT for scraped_posts that skips ids already stored, if the backend has one."""
+        table = ScrapedPostDB.__table__
+        dialect = self.engine.dialect.name
+        
+        if dialect == "postgresql":
+            return pg_insert(table).on_conflict_do_nothing(index_elements=["id"])
+        if dialect == "sqlite":
+            return sqlite_insert(table).on_conflict_do_nothing()
+        if dialect in ("mysql", "mariadb"):
+            return table.insert().prefix_with("IGNORE")
+        return None
+        
+    def _cached(self, cache: TTLCache, key: Hashable, load: Callable[[], Any]) -> Any:
+        """Return a cached read, loading and storing it on a miss."""
+        with self._cache_lock:
+            if key in cache:
+                return cache[key]
+                
+        value = load()
+        if value is not None:
+            with self._cache_lock:
+                cache[key] = value
+        return value
+        
+    def _invalidate_posts(self):
+        """Drop cached post listings after new posts are stored."""
+        with self._cache_lock:
+            self._posts_cache.clear()
+            
+    def _invalidate_job(self, job_id: str):
+        """Drop a cached job after it changes."""
+        with self._cache_lock:
+            self._job_cache.pop(job_id, None)
         
     def get_session(self) -> Session:
         """Get a new database session."""
@@ -132,8 +387,46 @@ class DatabaseManager:
             db.add(post)
             db.commit()
             db.refresh(post)
-            return post.id
+        self._invalidate_posts()
+        return post.id
+
+    @_retry_on_disconnect
+    def save_posts_bulk(self, posts_data: List[dict]) -> int:
+        """Save a batch of scraped posts with a single executemany INSERT."""
+        if not posts_data:
+            return 0
+
+        if self._insert_ignore is not None:
+            # Duplicates are dropped by the database in the same round-trip
+            with self.get_session() as db:
+                result = db.execute(self._insert_ignore, posts_data)
+                db.commit()
+            self._invalidate_posts()
+            return result.rowcount if result.rowcount >= 0 else len(posts_data)
+
+        insert_stmt = ScrapedPostDB.__table__.insert()
+        with self.get_session() as db:
+            try:
+                db.execute(insert_stmt, posts_data)
+                db.commit()
+                self._invalidate_posts()
+                return len(posts_data)
+            except IntegrityError:
+                db.rollback()
             
+            # Some posts are already stored; retry one at a time and skip those
+            saved = 0
+            for post_data in posts_data:
+                try:
+                    with db.begin_nested():
+                        db.execute(insert_stmt, post_data)
+                    saved += 1
+                except IntegrityError:
+                    logger.debug(f"Skipping duplicate post {post_data.get('id')}")
+            db.commit()
+        self._invalidate_posts()
+        return saved
+
     def save_job(self, job_data: dict) -> str:
         """Save a scraping job to the database."""
         with self.get_session() as db:
@@ -141,30 +434,57 @@ class DatabaseManager:
             db.add(job)
             db.commit()
             db.refresh(job)
-            return job.job_id
+        self._invalidate_job(job.job_id)
+        return job.job_id
             
+    @_retry_on_disconnect
     def update_job_status(self, job_id: str, status: str, **kwargs):
         """Update job status and other fields."""
+        columns = ScrapingJobDB.__table__.c
+        values = {key: value for key, value in kwargs.items() if key in columns}
+        
+        # A single UPDATE; no need to load the row first
         with self.get_session() as db:
-            job = db.query(ScrapingJobDB).filter(ScrapingJobDB.job_id == job_id).first()
-            if job:
-                job.status = status
-                for key, value in kwargs.items():
-                    if hasattr(job, key):
-                        setattr(job, key, value)
-                db.commit()
+            db.execute(
+                update(ScrapingJobDB)
+                .where(ScrapingJobDB.job_id == job_id)
+                .values(status=status, **values)
+            )
+            db.commit()
+        self._invalidate_job(job_id)
                 
+    @_retry_on_disconnect
     def get_posts_by_platform(self, platform: str, limit: int = 100) -> List[ScrapedPostDB]:
         """Get posts by platform."""
+        def load():
+            with self.get_session() as db:
+                return db.execute(
+                    POSTS_BY_PLATFORM_SQL, {"platform": platform, "limit": limit}
+                ).scalars().all()
+                
+        return self._cached(self._posts_cache, (platform, limit), load)
+            
+    def iter_posts(self, platform: Optional[str] = None, limit: int = 1000, chunk_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """Stream the newest posts as dicts, fetching chunk_size rows at a time."""
+        columns = [getattr(ScrapedPostDB, name) for name in POST_EXPORT_COLUMNS]
+        
         with self.get_session() as db:
-            return db.query(ScrapedPostDB).filter(
-                ScrapedPostDB.platform == platform
-            ).order_by(ScrapedPostDB.scraped_at.desc()).limit(limit).all()
+            query = db.query(*columns)
+            if platform:
+                query = query.filter(ScrapedPostDB.platform == platform)
+            query = query.order_by(ScrapedPostDB.scraped_at.desc()).limit(limit)
             
+            for row in query.yield_per(chunk_size):
+                yield row._asdict()
+            
+    @_retry_on_disconnect
     def get_job_status(self, job_id: str) -> ScrapingJobDB:
         """Get job status by ID."""
-        with self.get_session() as db:
-            return db.query(ScrapingJobDB).filter(ScrapingJobDB.job_id == job_id).first()
+        def load():
+            with self.get_session() as db:
+                return db.execute(JOB_BY_ID_SQL, {"job_id": job_id}).scalars().first()
+                
+        return self._cached(self._job_cache, job_id, load)
 
 
 # Global database manager instance
@@ -2,7 +2,7 @@
 Scrapers package with multiple strategies.
 """
 
-from .base import BaseScraper
+from .base import BaseScraper, CommentCapable, SearchCapable
 from .manager import EnhancedScraperManager, scraper_manager
 from .reddit_scraper import RedditScraper
 from .reddit_web_scraper import RedditWebScraper
@@ -10,6 +10,8 @@ from .reddit_feed_scraper import RedditFeedScraper
 
 __all__ = [
     'BaseScraper',
+    'CommentCapable',
+    'SearchCapable',
     'EnhancedScraperManager',
     'scraper_manager',
     'RedditScraper',
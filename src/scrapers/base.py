@@ -2,9 +2,12 @@
 Base scraper class and common utilities.
 """
 import asyncio
+import re
 import aiohttp
+import orjson
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, AsyncGenerator
+from functools import lru_cache
+from typing import Callable, List, Dict, Any, Optional, AsyncGenerator, Pattern, Protocol, Set, Tuple, runtime_checkable
 from datetime import datetime, timedelta
 from loguru import logger
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
@@ -16,6 +19,111 @@ from ..config import settings
 from ..database import db_manager
 
 
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+
+def create_http_session(headers: Optional[Dict[str, str]] = None) -> aiohttp.ClientSession:
+    """Create the pooled HTTP session used by the scrapers."""
+    connector = aiohttp.TCPConnector(
+        limit=settings.max_concurrent_requests,
+        limit_per_host=10,
+        ttl_dns_cache=300,
+        use_dns_cache=True,
+        keepalive_timeout=75,  # Keep idle connections to reddit.com warm between pages and jobs
+        ssl=False  # Disable SSL verification for web scraping
+    )
+    
+    timeout = aiohttp.ClientTimeout(total=30, connect=10)
+    
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=timeout,
+        headers=headers or DEFAULT_HEADERS
+    )
+
+
+# Naive UTC, like the datetime.utcnow() values stored elsewhere
+_EPOCH = datetime(1970, 1, 1)
+
+
+def from_utc_timestamp(ts: float) -> datetime:
+    """Convert a Unix timestamp to a naive UTC datetime without a tz database lookup."""
+    return _EPOCH + timedelta(seconds=ts)
+
+
+def post_to_row(post: ScrapedPost) -> Dict[str, Any]:
+    """Dump a post as a scraped_posts row, dropping raw_data unless it is kept."""
+    exclude = None if settings.store_raw_data else {"raw_data"}
+    return post.model_dump(mode="python", exclude=exclude)
+
+
+async def save_queued_rows(
+    queue: asyncio.Queue, on_error: Optional[Callable[[List[dict], Exception], None]] = None
+) -> int:
+    """Save queued post rows in batches off the event loop until a None arrives; returns rows saved."""
+    saved = 0
+    batch: List[dict] = []
+    
+    while True:
+        row = await queue.get()
+        if row is not None:
+            batch.append(row)
+            
+        if batch and (row is None or len(batch) >= settings.insert_batch_size):
+            try:
+                saved += await asyncio.to_thread(db_manager.save_posts_bulk, batch)
+            except Exception as e:
+                # A failed batch is reported and dropped; later batches still save
+                logger.error(f"Error saving {len(batch)} posts: {e}")
+                if on_error:
+                    on_error(batch, e)
+            batch = []
+            
+        if row is None:
+            return saved
+
+
+def scan_tags(
+    text: Optional[str], pattern: Pattern, markers: Tuple[str, ...], hashtags: List[str], mentions: List[str]
+):
+    """Append the hashtags (pattern group 1) and mentions (group 2) found in text to the given lists."""
+    # Most posts have neither; substring checks are far cheaper than a regex scan
+    if text and any(marker in text for marker in markers):
+        for hashtag, mention in pattern.findall(text):
+            if hashtag:
+                hashtags.append(hashtag)
+            else:
+                mentions.append(mention)
+
+
+# (platform, strategy) pairs that already have a log file sink
+_LOG_SINKS: Set[Tuple[str, str]] = set()
+
+
+@lru_cache(maxsize=128)
+def _keyword_pattern(keywords: Tuple[str, ...]) -> Pattern:
+    """Compile keywords into one case-insensitive alternation, scanned in a single pass."""
+    return re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
+
+
+@runtime_checkable
+class SearchCapable(Protocol):
+    """A scraper that can search posts by query."""
+    
+    def scrape_search(self, query: str, max_posts: int = 100, **kwargs) -> AsyncGenerator[ScrapedPost, None]:
+        ...
+
+
+@runtime_checkable
+class CommentCapable(Protocol):
+    """A scraper that can fetch the comments of a post."""
+    
+    def scrape_comments(self, post_id: str, max_comments: int = 100) -> AsyncGenerator[ScrapedPost, None]:
+        ...
+
+
 class RateLimiter:
     """Async rate limiter for API requests."""
     
@@ -38,47 +146,53 @@ class BaseScraper(ABC):
             settings.rate_limit_window
         )
         self.session: Optional[aiohttp.ClientSession] = None
+        self._owns_session = False
         self._setup_logging()
         
     def _setup_logging(self):
         """Set up logging for the scraper."""
+        # loguru sinks are process-wide, so add each log file only once
+        key = (self.platform.value, self.strategy.value)
+        if key in _LOG_SINKS:
+            return
+            
         logger.add(
             f"logs/{self.platform.value}_{self.strategy.value}_scraper.log",
             rotation="1 day",
             retention="30 days",
             level=settings.log_level,
-            format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {name}:{function}:{line} | {message}"
+            format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {name}:{function}:{line} | {message}",
+            enqueue=True  # Write from a background thread, not the event loop
         )
+        _LOG_SINKS.add(key)
         
     async def __aenter__(self):
         """Async context manager entry."""
-        connector = aiohttp.TCPConnector(
-            limit=settings.max_concurrent_requests,
-            limit_per_host=10,
-            ttl_dns_cache=300,
-            use_dns_cache=True,
-            ssl=False  # Disable SSL verification for web scraping
-        )
-        
-        timeout = aiohttp.ClientTimeout(total=30, connect=10)
-        
-        self.session = aiohttp.ClientSession(
-            connector=connector,
-            timeout=timeout,
-            headers=self._get_default_headers()
-        )
+        self._ensure_session()
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        if self.session:
+        await self.close()
+        
+    async def close(self):
+        """Close the HTTP session if this scraper opened it; a shared one is left alone."""
+        if self.session and self._owns_session:
             await self.session.close()
+            self.session = None
+            self._owns_session = False
             
+    def _ensure_session(self) -> aiohttp.ClientSession:
+        """Return the HTTP session, opening a pooled one on first use."""
+        # A manager may have handed us a shared session already
+        if self.session is None or self.session.closed:
+            self.session = create_http_session(self._get_default_headers())
+            self._owns_session = True
+        return self.session
+        
     def _get_default_headers(self) -> Dict[str, str]:
         """Get default headers for HTTP requests."""
-        return {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
+        return dict(DEFAULT_HEADERS)
         
     @retry(
         stop=stop_after_attempt(3),
@@ -90,11 +204,12 @@ class BaseScraper(ABC):
         await self.rate_limiter.acquire()
         
         try:
-            async with self.session.get(url, **kwargs) as response:
+            async with self._ensure_session().get(url, **kwargs) as response:
                 response.raise_for_status()
                 
                 if 'application/json' in response.headers.get('content-type', ''):
-                    return await response.json()
+                    # Listings and comment trees run to megabytes; orjson parses them much faster
+                    return orjson.loads(await response.read())
                 else:
                     return {'text': await response.text()}
                     
@@ -105,6 +220,24 @@ class BaseScraper(ABC):
             logger.error(f"Request failed for URL {url}: {str(e)}")
             raise
             
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=4, max=10),
+        retry=retry_if_exception_type((aiohttp.ClientError, asyncio.TimeoutError))
+    )
+    async def _open_response(self, url: str, **kwargs) -> aiohttp.ClientResponse:
+        """Send a rate-limited GET with retry logic, returning before the body is read."""
+        await self.rate_limiter.acquire()
+        
+        response = await self._ensure_session().get(url, **kwargs)
+        try:
+            response.raise_for_status()
+        except aiohttp.ClientResponseError as e:
+            response.release()
+            logger.error(f"HTTP error {e.status} for URL {url}: {e.message}")
+            raise
+        return response
+        
     @abstractmethod
     async def scrape_posts(self, target: str, max_posts: int = 100, **kwargs) -> AsyncGenerator[ScrapedPost, None]:
         """Scrape posts from the platform."""
@@ -121,7 +254,8 @@ class BaseScraper(ABC):
         
         try:
             # Update job status
-            db_manager.update_job_status(
+            await asyncio.to_thread(
+                db_manager.update_job_status,
                 job.job_id, 
                 "running", 
                 started_at=result.started_at
@@ -131,36 +265,43 @@ class BaseScraper(ABC):
             
             posts_scraped = 0
             comments_scraped = 0
+            keyword_re = _keyword_pattern(tuple(job.keywords)) if job.keywords else None
+            
+            # Rows are saved by a writer task while scraping carries on;
+            # the bound keeps a slow database from buffering the whole job
+            queue: asyncio.Queue = asyncio.Queue(maxsize=2 * settings.insert_batch_size)
+            writer = asyncio.create_task(save_queued_rows(
+                queue, lambda batch, e: result.errors.append(f"Batch save error: {str(e)}")
+            ))
             
-            # Scrape posts
-            async for post in self.scrape_posts(job.target, job.max_posts):
-                try:
-                    # Filter by keywords if specified
-                    if job.keywords and not self._matches_keywords(post.content, job.keywords):
-                        continue
+            try:
+                # Scrape posts
+                async for post in self.scrape_posts(job.target, job.max_posts):
+                    try:
+                        # Filter by keywords if specified
+                        if keyword_re and not keyword_re.search(post.content):
+                            continue
+                            
+                        # Queue post for the next bulk insert
+                        await queue.put(post_to_row(post))
+                        posts_scraped += 1
                         
-                    # Save post to database
-                    post_data = post.dict()
-                    db_manager.save_post(post_data)
-                    posts_scraped += 1
-                    
-                    # Scrape comments if requested
-                    if job.include_comments:
-                        async for comment in self.scrape_comments(post.id):
-                            try:
-                                comment_data = comment.dict()
-                                db_manager.save_post(comment_data)
+                        # Scrape comments if requested
+                        if job.include_comments:
+                            async for comment in self.scrape_comments(post.id):
+                                await queue.put(post_to_row(comment))
                                 comments_scraped += 1
-                            except Exception as e:
-                                logger.error(f"Error saving comment: {str(e)}")
-                                result.errors.append(f"Comment save error: {str(e)}")
                                 
-                    # Add delay between posts
-                    await asyncio.sleep(settings.request_delay)
-                    
-                except Exception as e:
-                    logger.error(f"Error processing post {post.id}: {str(e)}")
-                    result.errors.append(f"Post processing error: {str(e)}")
+                        # Add delay between posts
+                        await asyncio.sleep(settings.request_delay)
+                        
+                    except Exception as e:
+                        logger.error(f"Error processing post {post.id}: {str(e)}")
+                        result.errors.append(f"Post processing error: {str(e)}")
+            finally:
+                # Keep whatever was scraped even if the job stops early
+                await queue.put(None)
+                await writer
                     
             result.posts_scraped = posts_scraped
             result.comments_scraped = comments_scraped
@@ -168,7 +309,8 @@ class BaseScraper(ABC):
             result.success = True
             
             # Update job status
-            db_manager.update_job_status(
+            await asyncio.to_thread(
+                db_manager.update_job_status,
                 job.job_id,
                 "completed",
                 posts_scraped=posts_scraped,
@@ -186,7 +328,8 @@ class BaseScraper(ABC):
             result.completed_at = datetime.utcnow()
             
             # Update job status
-            db_manager.update_job_status(
+            await asyncio.to_thread(
+                db_manager.update_job_status,
                 job.job_id,
                 "failed",
                 completed_at=result.completed_at,
@@ -197,8 +340,9 @@ class BaseScraper(ABC):
         
     def _matches_keywords(self, content: str, keywords: List[str]) -> bool:
         """Check if content matches any of the specified keywords."""
-        content_lower = content.lower()
-        return any(keyword.lower() in content_lower for keyword in keywords)
+        if not keywords:
+            return False
+        return _keyword_pattern(tuple(keywords)).search(content) is not None
         
     async def health_check(self) -> bool:
         """Perform health check for the scraper."""
@@ -2,7 +2,12 @@
 Enhanced scraper manager with multiple strategies and automatic fallback.
 """
 import asyncio
-from typing import Dict, List, Optional, Union, Any
+import functools
+import random
+import re
+import time
+from collections import OrderedDict
+from typing import AsyncIterator, Callable, Dict, List, Optional, Tuple, Union, Any
 from datetime import datetime, timedelta
 from loguru import logger
 import uuid
@@ -10,11 +15,52 @@ import uuid
 from ..models import Platform, ScrapingJob, ScrapingResult, ScrapingStrategy
 from ..config import settings
 from ..database import db_manager
+from .base import CommentCapable, SearchCapable, create_http_session, post_to_row, save_queued_rows
 from .reddit_scraper import RedditScraper
 from .reddit_web_scraper import RedditWebScraper  
 from .reddit_feed_scraper import RedditFeedScraper
 # from .twitter_scraper import TwitterScraper
 
+# Full-jitter backoff between fallback attempts, in seconds
+FALLBACK_BACKOFF_BASE = 0.2
+FALLBACK_BACKOFF_CAP = 5.0
+
+# Consecutive failures before a strategy is skipped, and for how long
+CIRCUIT_FAILURE_THRESHOLD = 3
+CIRCUIT_OPEN_SECONDS = 60.0
+
+# Fallback order when no strategy is preferred: web -> feed -> api
+DEFAULT_STRATEGY_ORDER = (ScrapingStrategy.WEB, ScrapingStrategy.FEED, ScrapingStrategy.API)
+
+# How long the first strategy runs alone before a hedged scrape starts the next
+HEDGE_DELAY = 0.5
+
+# Most scrape results kept for reuse; the oldest are evicted first
+SCRAPE_CACHE_MAX_ENTRIES = 512
+
+# Posts a job may buffer ahead of its database writer before scraping waits
+JOB_QUEUE_MAX_POSTS = 500
+
+# Job states that never change again, and how many such jobs to remember
+TERMINAL_JOB_STATUSES = frozenset({'completed', 'failed', 'cancelled'})
+STATUS_CACHE_MAX_ENTRIES = 1024
+
+# Seconds a passing scraper health check is reused before probing again
+HEALTH_CHECK_TTL = 60.0
+
+# Leading "r/" or "/r/" on a subreddit name
+_SUBREDDIT_PREFIX_RE = re.compile(r"^/?r/", re.IGNORECASE)
+
+
+def _normalize_target(platform: Platform, target: str) -> str:
+    """Canonical subreddit or Twitter handle, so "r/Python" and "/r/python" are one target."""
+    target = target.strip()
+    if platform == Platform.REDDIT:
+        return _SUBREDDIT_PREFIX_RE.sub("", target).strip("/").lower()
+    if platform == Platform.TWITTER:
+        return "@" + target.lstrip("@").lower()
+    return target
+
 
 class EnhancedScraperManager:
     """Enhanced manager with multiple scraping strategies and automatic fallback."""
@@ -22,71 +68,154 @@ class EnhancedScraperManager:
     def __init__(self):
         self.strategies: Dict[Platform, Dict[ScrapingStrategy, Any]] = {}
         self.active_jobs: Dict[str, asyncio.Task] = {}
+        self._job_done: Dict[str, asyncio.Event] = {}
+        self._job_slots = asyncio.Semaphore(settings.max_concurrent_jobs)
+        # Fallback orders and scraper capabilities, fixed once scrapers are up
+        self._order: Dict[Platform, Tuple[ScrapingStrategy, ...]] = {}
+        self._search_order: Dict[Platform, Tuple[ScrapingStrategy, ...]] = {}
+        self._caps: Dict[Tuple[Platform, ScrapingStrategy], Dict[str, bool]] = {}
+        # (platform, strategy) -> (consecutive failures, monotonic time the circuit reopens)
+        self._strategy_failures: Dict[Tuple[Platform, ScrapingStrategy], Tuple[int, float]] = {}
+        # Recent scrape results and scrapes in progress, keyed by _scrape_key
+        self._result_cache: "OrderedDict[Tuple, Tuple[float, Tuple[Any, ...]]]" = OrderedDict()
+        self._inflight: Dict[Tuple, asyncio.Future] = {}
+        # Status dicts of finished jobs, least recently used first
+        self._status_cache: "OrderedDict[str, Dict]" = OrderedDict()
+        # Scraper name -> monotonic time its last passing health check expires
+        self._healthy_until: Dict[str, float] = {}
+        self._http_ready = False
+        self._session = None
         
     async def __aenter__(self):
         """Initialize all available scrapers with fallback strategies."""
+        await self.ensure_db()
+        await self.ensure_http()
+        return self
+        
+    async def ensure_db(self):
+        """Prepare the database only, which is all read-only commands need."""
+        await self._db(db_manager.create_tables)
+        
+    async def _db(self, fn: Callable, *args, **kwargs) -> Any:
+        """Run a blocking db_manager call on a worker thread."""
+        return await asyncio.to_thread(fn, *args, **kwargs)
+        
+    async def ensure_http(self):
+        """Initialize the HTTP-backed scrapers on first use."""
+        if self._http_ready:
+            return
+            
         logger.info("Initializing enhanced scraper manager with multiple strategies...")
         
+        # One connection pool shared by every scraper
+        self._session = create_http_session()
+        
         # Initialize Reddit scrapers
         await self._init_reddit_scrapers()
         
         # Initialize Twitter scrapers (future enhancement)
         # await self._init_twitter_scrapers()
         
+        self._index_strategies()
+        self._http_ready = True
         logger.info(f"Scraper manager initialized with strategies: {list(self.strategies.keys())}")
-        return self
         
     async def _init_reddit_scrapers(self):
         """Initialize Reddit scrapers with multiple strategies."""
         self.strategies[Platform.REDDIT] = {}
         
+        # (strategy, scraper class, label, log level if it fails to start)
+        candidates = []
+        
         # Try API scraper first (if enabled and credentials available)
         if settings.enable_api_scrapers:
-            try:
-                reddit_api = RedditScraper()
-                await reddit_api.__aenter__()
-                self.strategies[Platform.REDDIT][ScrapingStrategy.API] = reddit_api
-                logger.info("✅ Reddit API scraper initialized")
-            except Exception as e:
-                logger.warning(f"❌ Reddit API scraper failed: {e}")
-        
-        # Always initialize web scraper (no credentials needed)
-        try:
-            reddit_web = RedditWebScraper()
-            await reddit_web.__aenter__()
-            self.strategies[Platform.REDDIT][ScrapingStrategy.WEB] = reddit_web
-            logger.info("✅ Reddit web scraper initialized")
-        except Exception as e:
-            logger.error(f"❌ Reddit web scraper failed: {e}")
+            candidates.append((ScrapingStrategy.API, RedditScraper, "Reddit API scraper", "WARNING"))
             
+        # Always initialize web scraper (no credentials needed)
+        candidates.append((ScrapingStrategy.WEB, RedditWebScraper, "Reddit web scraper", "ERROR"))
+        
         # Initialize RSS feed scraper
-        try:
-            reddit_feed = RedditFeedScraper()
-            await reddit_feed.__aenter__()
-            self.strategies[Platform.REDDIT][ScrapingStrategy.FEED] = reddit_feed
-            logger.info("✅ Reddit RSS feed scraper initialized")
-        except Exception as e:
-            logger.warning(f"❌ Reddit RSS feed scraper failed: {e}")
+        candidates.append((ScrapingStrategy.FEED, RedditFeedScraper, "Reddit RSS feed scraper", "WARNING"))
+        
+        # Start them concurrently; startup takes as long as the slowest one
+        results = await asyncio.gather(
+            *(self._start_scraper(scraper_cls) for _, scraper_cls, _, _ in candidates),
+            return_exceptions=True
+        )
+        
+        for (strategy, _, label, level), result in zip(candidates, results):
+            if isinstance(result, Exception):
+                logger.log(level, f"❌ {label} failed: {result}")
+            else:
+                self.strategies[Platform.REDDIT][strategy] = result
+                logger.info(f"✅ {label} initialized")
+                
+    async def _start_scraper(self, scraper_cls):
+        """Create a scraper on the shared session and enter its context."""
+        scraper = scraper_cls()
+        scraper.session = self._session
+        await scraper.__aenter__()
+        return scraper
+            
+    def _index_strategies(self):
+        """Precompute each platform's fallback orders and scraper capabilities."""
+        self._order.clear()
+        self._search_order.clear()
+        self._caps.clear()
+        
+        for platform, strategies in self.strategies.items():
+            for strategy, scraper in strategies.items():
+                self._caps[(platform, strategy)] = {
+                    'search': isinstance(scraper, SearchCapable),
+                    'comments': isinstance(scraper, CommentCapable),
+                }
+            self._order[platform] = tuple(s for s in DEFAULT_STRATEGY_ORDER if s in strategies)
+            self._search_order[platform] = tuple(
+                s for s in strategies if self._caps[(platform, s)]['search']
+            )
             
+    @staticmethod
+    def _strategy_order(
+        order: Tuple[ScrapingStrategy, ...], preferred_strategy: Optional[ScrapingStrategy]
+    ) -> List[ScrapingStrategy]:
+        """Put the preferred strategy first when it is one of the available ones."""
+        if preferred_strategy in order:
+            return list(dict.fromkeys((preferred_strategy,) + order))
+        return list(order)
+        
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Clean up all scrapers."""
-        for platform_strategies in self.strategies.values():
-            for scraper in platform_strategies.values():
-                if hasattr(scraper, '__aexit__'):
-                    try:
-                        await scraper.__aexit__(exc_type, exc_val, exc_tb)
-                    except Exception as e:
-                        logger.error(f"Error closing scraper: {e}")
-                        
-        # Cancel active jobs
-        for job_id, task in self.active_jobs.items():
-            if not task.done():
-                task.cancel()
-                try:
-                    await task
-                except asyncio.CancelledError:
-                    pass
-                logger.info(f"Cancelled job: {job_id}")
+        # Cancel active jobs all at once and wait for them together first,
+        # so none wakes up mid-shutdown to a closed session or missing scraper
+        cancelled = {job_id: task for job_id, task in self.active_jobs.items() if not task.done()}
+        for task in cancelled.values():
+            task.cancel()
+        await asyncio.gather(*cancelled.values(), return_exceptions=True)
+        
+        for job_id in cancelled:
+            logger.info(f"Cancelled job: {job_id}")
+            
+        scrapers = [
+            scraper
+            for platform_strategies in self.strategies.values()
+            for scraper in platform_strategies.values()
+            if hasattr(scraper, '__aexit__')
+        ]
+        results = await asyncio.gather(
+            *(scraper.__aexit__(exc_type, exc_val, exc_tb) for scraper in scrapers),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error closing scraper: {result}")
+                
+        if self._session:
+            await self._session.close()
+            self._session = None
+            
+        self.strategies.clear()
+        self._index_strategies()
+        self._http_ready = False
                 
     async def scrape_with_fallback(
         self, 
@@ -94,6 +223,9 @@ class EnhancedScraperManager:
         target: str, 
         max_posts: int = 100,
         preferred_strategy: Optional[ScrapingStrategy] = None,
+        on_post: Optional[Callable[[Any], None]] = None,
+        force_rescrape: bool = False,
+        hedge: bool = False,
         **kwargs
     ) -> List[Any]:
         """
@@ -104,58 +236,277 @@ class EnhancedScraperManager:
             target: Target to scrape (subreddit, username, etc.)
             max_posts: Maximum number of posts
             preferred_strategy: Preferred strategy to try first
+            on_post: Called with each post as soon as it is scraped
+            force_rescrape: Ignore a cached result for the same request
+            hedge: Race the next strategy if the first is slow to finish
             **kwargs: Additional arguments for scrapers
         """
+        posts = []
+        async for post in self.stream_with_fallback(
+            platform, target, max_posts, preferred_strategy,
+            force_rescrape=force_rescrape, hedge=hedge, **kwargs
+        ):
+            posts.append(post)
+            if on_post:
+                on_post(post)
+        return posts
+        
+    async def stream_with_fallback(
+        self, 
+        platform: Platform, 
+        target: str, 
+        max_posts: int = 100,
+        preferred_strategy: Optional[ScrapingStrategy] = None,
+        force_rescrape: bool = False,
+        hedge: bool = False,
+        **kwargs
+    ) -> AsyncIterator[Any]:
+        """
+        Yield posts as they are scraped, with automatic fallback strategies.
+        
+        A fresh result for the same request is replayed from the cache, and
+        concurrent identical requests share one scrape.
+        """
+        key = self._scrape_key(platform, target, max_posts, preferred_strategy, kwargs)
+        
+        if key is not None and not force_rescrape:
+            cached = self._cached_result(key)
+            if cached is None and key in self._inflight:
+                # Someone is already scraping this; wait for their posts
+                cached = await asyncio.shield(self._inflight[key])
+            if cached is not None:
+                logger.bind(platform=platform.value, target=target).info(
+                    "Reusing {} cached posts for {} '{}'", len(cached), platform.value, target
+                )
+                for post in cached:
+                    yield post
+                return
+                
+        scrape = self._hedged_strategies if hedge else self._stream_strategies
+        
+        if key is None:
+            async for post in scrape(platform, target, max_posts, preferred_strategy, **kwargs):
+                yield post
+            return
+            
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        posts = []
+        completed = False
+        
+        try:
+            async for post in scrape(platform, target, max_posts, preferred_strategy, **kwargs):
+                posts.append(post)
+                yield post
+            completed = True
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+            # Waiters get None for a scrape that did not finish and run their own
+            future.set_result(tuple(posts) if completed else None)
+            if completed and posts:
+                self._store_result(key, posts)
+                
+    def _scrape_key(
+        self,
+        platform: Platform,
+        target: str,
+        max_posts: int,
+        preferred_strategy: Optional[ScrapingStrategy],
+        kwargs: Dict[str, Any]
+    ) -> Optional[Tuple]:
+        """Key a scrape request for the result cache, or None if it can't be cached."""
+        if settings.scrape_cache_ttl <= 0:
+            return None
+        if platform == Platform.REDDIT:
+            target = _normalize_target(platform, target)
+        key = (platform, target, max_posts, preferred_strategy, frozenset(kwargs.items()))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+        
+    def _cached_result(self, key: Tuple) -> Optional[Tuple[Any, ...]]:
+        """Return cached posts for a request if they are still fresh."""
+        entry = self._result_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, posts = entry
+        if expires_at <= time.monotonic():
+            del self._result_cache[key]
+            return None
+        self._result_cache.move_to_end(key)
+        return posts
+        
+    def _store_result(self, key: Tuple, posts: List[Any]):
+        """Cache a finished scrape, evicting the least recently used entries."""
+        self._result_cache[key] = (time.monotonic() + settings.scrape_cache_ttl, tuple(posts))
+        self._result_cache.move_to_end(key)
+        while len(self._result_cache) > SCRAPE_CACHE_MAX_ENTRIES:
+            self._result_cache.popitem(last=False)
+            
+    async def _hedged_strategies(
+        self, 
+        platform: Platform, 
+        target: str, 
+        max_posts: int = 100,
+        preferred_strategy: Optional[ScrapingStrategy] = None,
+        **kwargs
+    ) -> AsyncIterator[Any]:
+        """
+        Yield posts from whichever strategy first returns some.
+        
+        The first strategy gets HEDGE_DELAY seconds to itself; after that, or
+        as soon as it fails, the next one runs alongside it. At most two run
+        at once and the loser is cancelled.
+        """
+        order = self._order.get(platform)
+        if not order:
+            raise ValueError(f"No working scrapers available for {platform}")
+            
+        remaining = self._skip_open_circuits(platform, self._strategy_order(order, preferred_strategy))
+        log = logger.bind(platform=platform.value, target=target)
+        running: Dict[asyncio.Task, ScrapingStrategy] = {}
+        last_error = None
+        
+        def launch():
+            strategy = remaining.pop(0)
+            task = asyncio.create_task(self._collect(platform, strategy, target, max_posts, **kwargs))
+            running[task] = strategy
+            
+        launch()
+        timeout = HEDGE_DELAY
+        posts = None
+        
+        try:
+            while running and not posts:
+                done, _ = await asyncio.wait(running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                timeout = None
+                
+                for task in done:
+                    strategy = running.pop(task)
+                    if task.exception() is not None:
+                        last_error = task.exception()
+                    elif task.result() and not posts:
+                        log.bind(strategy=strategy.value).info(
+                            "Scraped {} posts with {} strategy", len(task.result()), strategy.value
+                        )
+                        posts = task.result()
+                        
+                # Start the hedge, or replace a strategy that came back empty-handed
+                while not posts and remaining and len(running) < 2:
+                    launch()
+        finally:
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+            
+        if not posts:
+            raise Exception(f"All scraping strategies failed for {platform}. Last error: {last_error}")
+            
+        for post in posts:
+            yield post
+            
+    async def _collect(
+        self, platform: Platform, strategy: ScrapingStrategy, target: str, max_posts: int, **kwargs
+    ) -> List[Any]:
+        """Run a single strategy to completion and return its posts."""
+        scraper = self.strategies[platform][strategy]
+        slog = logger.bind(platform=platform.value, target=target, strategy=strategy.value)
+        slog.debug("Trying {} strategy for {}", strategy.value, platform.value)
+        
+        try:
+            posts = [post async for post in scraper.scrape_posts(target, max_posts, **kwargs)]
+        except Exception as e:
+            slog.warning("{} strategy failed: {}", strategy.value, e)
+            self._record_failure(platform, strategy)
+            raise
+            
+        self._record_success(platform, strategy)
+        if not posts:
+            slog.warning("{} strategy returned no posts", strategy.value)
+        return posts
+        
+    async def _stream_strategies(
+        self, 
+        platform: Platform, 
+        target: str, 
+        max_posts: int = 100,
+        preferred_strategy: Optional[ScrapingStrategy] = None,
+        **kwargs
+    ) -> AsyncIterator[Any]:
+        """Yield posts from the first scraping strategy that works."""
         if platform not in self.strategies:
             raise ValueError(f"No scrapers available for {platform}")
             
-        available_strategies = list(self.strategies[platform].keys())
-        
-        if not available_strategies:
+        order = self._order.get(platform)
+        if not order:
             raise ValueError(f"No working scrapers available for {platform}")
             
-        # Determine strategy order
-        if preferred_strategy and preferred_strategy in available_strategies:
-            strategies_to_try = [preferred_strategy]
-            # Add other strategies as fallbacks  
-            for strategy in [ScrapingStrategy.WEB, ScrapingStrategy.FEED, ScrapingStrategy.API]:
-                if strategy != preferred_strategy and strategy in available_strategies:
-                    strategies_to_try.append(strategy)
-        else:
-            # Default order: web -> feed -> api
-            strategies_to_try = []
-            default_order = [ScrapingStrategy.WEB, ScrapingStrategy.FEED, ScrapingStrategy.API]
-            for strategy in default_order:
-                if strategy in available_strategies:
-                    strategies_to_try.append(strategy)
-                    
-        if not strategies_to_try:
-            raise ValueError(f"No strategies available for {platform}")
+        async for post in self._stream_fallback(
+            platform,
+            order,
+            preferred_strategy,
+            lambda scraper: scraper.scrape_posts(target, max_posts, **kwargs),
+            logger.bind(platform=platform.value, target=target),
+            "scraping",
+        ):
+            yield post
             
+    async def _stream_fallback(
+        self,
+        platform: Platform,
+        order: Tuple[ScrapingStrategy, ...],
+        preferred_strategy: Optional[ScrapingStrategy],
+        run: Callable[[Any], AsyncIterator[Any]],
+        log,
+        kind: str,
+    ) -> AsyncIterator[Any]:
+        """
+        Yield posts from run(scraper) for the first strategy in order that works.
+        
+        The next strategy is only tried when one fails or yields nothing;
+        once posts have been yielded, a later error ends the stream instead.
+        """
+        strategies_to_try = self._strategy_order(order, preferred_strategy)
+        strategies_to_try = self._skip_open_circuits(platform, strategies_to_try)
         last_error = None
         
-        for strategy in strategies_to_try:
+        for attempt, strategy in enumerate(strategies_to_try):
+            if attempt and last_error is not None:
+                await self._fallback_backoff(platform, strategies_to_try[attempt - 1])
+                
+            slog = log.bind(strategy=strategy.value)
+            yielded = 0
             try:
                 scraper = self.strategies[platform][strategy]
-                logger.info(f"🔄 Trying {strategy.value} strategy for {platform.value}")
+                slog.debug("Trying {} {} for {}", strategy.value, kind, platform.value)
                 
-                posts = []
-                async for post in scraper.scrape_posts(target, max_posts, **kwargs):
-                    posts.append(post)
+                async for post in run(scraper):
+                    yielded += 1
+                    yield post
                     
-                if posts:
-                    logger.info(f"✅ Successfully scraped {len(posts)} posts with {strategy.value} strategy")
-                    return posts
+                self._record_success(platform, strategy)
+                last_error = None
+                if yielded:
+                    slog.info("Got {} posts from {} {}", yielded, strategy.value, kind)
+                    return
                 else:
-                    logger.warning(f"⚠️ {strategy.value} strategy returned no posts")
+                    slog.warning("{} {} returned no posts", strategy.value, kind)
                     continue
                     
             except Exception as e:
-                logger.warning(f"❌ {strategy.value} strategy failed: {e}")
+                slog.warning("{} {} failed: {}", strategy.value, kind, e)
+                self._record_failure(platform, strategy)
+                if yielded:
+                    # Those posts are already out; a fallback would repeat them
+                    slog.warning("Keeping {} posts from {} {}", yielded, strategy.value, kind)
+                    return
                 last_error = e
                 continue
                 
-        raise Exception(f"All scraping strategies failed for {platform}. Last error: {last_error}")
+        raise Exception(f"All {kind} strategies failed for {platform}. Last error: {last_error}")
         
     async def scrape_search_with_fallback(
         self,
@@ -163,57 +514,104 @@ class EnhancedScraperManager:
         query: str,
         max_posts: int = 100,
         preferred_strategy: Optional[ScrapingStrategy] = None,
+        on_post: Optional[Callable[[Any], None]] = None,
         **kwargs
     ) -> List[Any]:
         """Search with fallback strategies."""
+        posts = []
+        async for post in self.stream_search_with_fallback(platform, query, max_posts, preferred_strategy, **kwargs):
+            posts.append(post)
+            if on_post:
+                on_post(post)
+        return posts
+        
+    async def stream_search_with_fallback(
+        self,
+        platform: Platform,
+        query: str,
+        max_posts: int = 100,
+        preferred_strategy: Optional[ScrapingStrategy] = None,
+        **kwargs
+    ) -> AsyncIterator[Any]:
+        """Yield search results as they arrive, with fallback strategies."""
         if platform not in self.strategies:
             raise ValueError(f"No scrapers available for {platform}")
             
-        available_strategies = list(self.strategies[platform].keys())
-        
-        # Some strategies don't support search, so filter them
-        search_capable_strategies = []
-        for strategy in available_strategies:
-            scraper = self.strategies[platform][strategy]
-            if hasattr(scraper, 'scrape_search'):
-                search_capable_strategies.append(strategy)
-                
-        if not search_capable_strategies:
+        # Some strategies don't support search; they were filtered out at startup
+        order = self._search_order.get(platform)
+        if not order:
             raise ValueError(f"No search-capable scrapers available for {platform}")
             
-        # Try preferred strategy first, then others
-        if preferred_strategy and preferred_strategy in search_capable_strategies:
-            strategies_to_try = [preferred_strategy]
-            for strategy in search_capable_strategies:
-                if strategy != preferred_strategy:
-                    strategies_to_try.append(strategy)
-        else:
-            strategies_to_try = search_capable_strategies
+        async for post in self._stream_fallback(
+            platform,
+            order,
+            preferred_strategy,
+            lambda scraper: scraper.scrape_search(query, max_posts, **kwargs),
+            logger.bind(platform=platform.value, query=query),
+            "search",
+        ):
+            yield post
             
-        last_error = None
-        
-        for strategy in strategies_to_try:
-            try:
-                scraper = self.strategies[platform][strategy]
-                logger.info(f"🔍 Searching with {strategy.value} strategy")
-                
-                posts = []
-                async for post in scraper.scrape_search(query, max_posts, **kwargs):
-                    posts.append(post)
-                    
-                if posts:
-                    logger.info(f"✅ Found {len(posts)} posts with {strategy.value} strategy")
-                    return posts
-                else:
-                    logger.warning(f"⚠️ {strategy.value} search returned no results")
-                    continue
-                    
-            except Exception as e:
-                logger.warning(f"❌ {strategy.value} search failed: {e}")
-                last_error = e
-                continue
+    def _skip_open_circuits(
+        self, platform: Platform, strategies: List[ScrapingStrategy]
+    ) -> List[ScrapingStrategy]:
+        """Drop strategies whose circuit is open, unless that would leave none to try."""
+        if not self._strategy_failures:
+            return strategies
+            
+        now = time.monotonic()
+        closed = []
+        for strategy in strategies:
+            if self._strategy_failures.get((platform, strategy), (0, 0.0))[1] <= now:
+                closed.append(strategy)
+            else:
+                logger.info("Skipping {} strategy for {}: circuit open", strategy.value, platform.value)
                 
-        raise Exception(f"All search strategies failed for {platform}. Last error: {last_error}")
+        return closed or strategies
+        
+    def _record_failure(self, platform: Platform, strategy: ScrapingStrategy):
+        """Count a failed attempt and open the circuit after repeated failures."""
+        failures, open_until = self._strategy_failures.get((platform, strategy), (0, 0.0))
+        failures += 1
+        
+        if failures >= CIRCUIT_FAILURE_THRESHOLD:
+            open_until = time.monotonic() + CIRCUIT_OPEN_SECONDS
+            logger.warning(f"{strategy.value} strategy for {platform.value} failed {failures} times in a row; "
+                           f"skipping it for {CIRCUIT_OPEN_SECONDS:.0f}s")
+            
+        self._strategy_failures[(platform, strategy)] = (failures, open_until)
+        
+    def _record_success(self, platform: Platform, strategy: ScrapingStrategy):
+        """Close the circuit for a strategy that answered."""
+        self._strategy_failures.pop((platform, strategy), None)
+        
+    async def _fallback_backoff(self, platform: Platform, failed: ScrapingStrategy):
+        """Sleep a jittered, exponentially growing delay before the next fallback."""
+        failures = self._strategy_failures.get((platform, failed), (1, 0.0))[0]
+        ceiling = min(FALLBACK_BACKOFF_CAP, FALLBACK_BACKOFF_BASE * 2 ** min(failures - 1, 10))
+        await asyncio.sleep(random.uniform(0, ceiling))
+        
+    async def scrape_and_save_with_fallback(self, *args, **kwargs) -> Tuple[List[Any], int]:
+        """Scrape with fallback while posts are saved in the background; returns (posts, saved)."""
+        return await self._scrape_and_save(self.scrape_with_fallback, *args, **kwargs)
+        
+    async def search_and_save_with_fallback(self, *args, **kwargs) -> Tuple[List[Any], int]:
+        """Search with fallback while posts are saved in the background; returns (posts, saved)."""
+        return await self._scrape_and_save(self.scrape_search_with_fallback, *args, **kwargs)
+        
+    async def _scrape_and_save(self, scrape, *args, **kwargs) -> Tuple[List[Any], int]:
+        """Run a scrape, feeding each post to a writer task as it arrives."""
+        queue: asyncio.Queue = asyncio.Queue()
+        writer = asyncio.create_task(save_queued_rows(queue))
+        
+        try:
+            posts = await scrape(*args, on_post=lambda post: queue.put_nowait(post_to_row(post)), **kwargs)
+        finally:
+            # Posts from a strategy that failed part-way are still saved
+            queue.put_nowait(None)
+            saved = await writer
+            
+        return posts, saved
         
     async def get_available_strategies(self, platform: Platform) -> List[ScrapingStrategy]:
         """Get list of available strategies for a platform."""
@@ -235,8 +633,8 @@ class EnhancedScraperManager:
                 info[platform]['strategy_details'][strategy] = {
                     'name': strategy.value,
                     'requires_auth': strategy == ScrapingStrategy.API,
-                    'supports_search': hasattr(scraper, 'scrape_search'),
-                    'supports_comments': hasattr(scraper, 'scrape_comments'),
+                    'supports_search': self._caps[(platform, strategy)]['search'],
+                    'supports_comments': self._caps[(platform, strategy)]['comments'],
                     'class': scraper.__class__.__name__
                 }
                 
@@ -254,6 +652,8 @@ class EnhancedScraperManager:
     ) -> str:
         """Create a new scraping job with strategy selection."""
         job_id = str(uuid.uuid4())
+        if platform == Platform.REDDIT:
+            target = _normalize_target(platform, target)
         
         job = ScrapingJob(
             job_id=job_id,
@@ -265,63 +665,88 @@ class EnhancedScraperManager:
         )
         
         # Save job to database
-        db_manager.save_job(job.dict())
+        await self._db(db_manager.save_job, job.model_dump())
         
         # Automatically start the job with fallback
         task = asyncio.create_task(
             self._run_job_with_fallback(job, strategy)
         )
-        self.active_jobs[job_id] = task
+        self._track_job(job_id, task)
         
         logger.info(f"Created and started scraping job {job_id} for {platform.value} target '{target}'")
         return job_id
         
+    def _track_job(self, job_id: str, task: asyncio.Task):
+        """Register a running job and signal its waiters when it finishes."""
+        self.active_jobs[job_id] = task
+        done = self._job_done.setdefault(job_id, asyncio.Event())
+        # Runs however the task ends, including cancellation before it started
+        task.add_done_callback(functools.partial(self._on_job_done, job_id))
+        task.add_done_callback(lambda _: done.set())
+        
+    def _on_job_done(self, job_id: str, task: asyncio.Task):
+        """Forget a finished job, unless the id was reused by a newer task."""
+        if self.active_jobs.get(job_id) is task:
+            del self.active_jobs[job_id]
+        
+    async def wait_for_job(self, job_id: str) -> Optional[Dict]:
+        """Wait for a job started in this process to finish and return its status."""
+        done = self._job_done.get(job_id)
+        if done:
+            await done.wait()
+            self._job_done.pop(job_id, None)
+        return await self.get_job_status(job_id)
+        
     async def _run_job_with_fallback(self, job: ScrapingJob, preferred_strategy: Optional[ScrapingStrategy] = None):
         """Run a scraping job with automatic fallback."""
-        try:
-            # Update job status to running
-            db_manager.update_job_status(job.job_id, "running", started_at=datetime.utcnow())
-            
-            posts = await self.scrape_with_fallback(
-                platform=job.platform,
-                target=job.target,
-                max_posts=job.max_posts,
-                preferred_strategy=preferred_strategy
-            )
+        # Jobs over the limit wait here, still "pending", until a slot frees up
+        async with self._job_slots:
+            try:
+                # Update job status to running
+                await self._db(db_manager.update_job_status, job.job_id, "running", started_at=datetime.utcnow())
             
-            # Save posts to database
-            posts_saved = 0
-            for post in posts:
+                # A writer task saves batches while the next pages are fetched;
+                # the bounded queue pauses scraping if the database falls behind
+                queue: asyncio.Queue = asyncio.Queue(maxsize=JOB_QUEUE_MAX_POSTS)
+                writer = asyncio.create_task(save_queued_rows(queue))
+                
                 try:
-                    db_manager.save_post(post.dict())
-                    posts_saved += 1
-                except Exception as e:
-                    logger.error(f"Error saving post {post.id}: {e}")
+                    async for post in self.stream_with_fallback(
+                        platform=job.platform,
+                        target=job.target,
+                        max_posts=job.max_posts,
+                        preferred_strategy=preferred_strategy
+                    ):
+                        if writer.done():
+                            break
+                        await queue.put(post_to_row(post))
+                finally:
+                    if not writer.done():
+                        await queue.put(None)
+                    posts_saved = await writer
                     
-            # Update job status to completed
-            db_manager.update_job_status(
-                job.job_id, 
-                "completed", 
-                completed_at=datetime.utcnow(),
-                posts_scraped=posts_saved,
-                success=True
-            )
+                # Update job status to completed
+                await self._db(
+                    db_manager.update_job_status,
+                    job.job_id, 
+                    "completed", 
+                    completed_at=datetime.utcnow(),
+                    posts_scraped=posts_saved,
+                    success=True
+                )
             
-            logger.info(f"Job {job.job_id} completed successfully. Saved {posts_saved} posts.")
+                logger.info(f"Job {job.job_id} completed successfully. Saved {posts_saved} posts.")
             
-        except Exception as e:
-            logger.error(f"Job {job.job_id} failed: {e}")
-            db_manager.update_job_status(
-                job.job_id, 
-                "failed", 
-                completed_at=datetime.utcnow(),
-                success=False,
-                errors=[str(e)]
-            )
-        finally:
-            # Remove from active jobs
-            if job.job_id in self.active_jobs:
-                del self.active_jobs[job.job_id]
+            except Exception as e:
+                logger.error(f"Job {job.job_id} failed: {e}")
+                await self._db(
+                    db_manager.update_job_status,
+                    job.job_id, 
+                    "failed", 
+                    completed_at=datetime.utcnow(),
+                    success=False,
+                    errors=[str(e)]
+                )
                 
     async def scrape_reddit_subreddit(
         self,
@@ -342,13 +767,18 @@ class EnhancedScraperManager:
         
     async def get_job_status(self, job_id: str) -> Optional[Dict]:
         """Get the status of a scraping job."""
-        job_data = db_manager.get_job_status(job_id)
+        cached = self._status_cache.get(job_id)
+        if cached is not None:
+            self._status_cache.move_to_end(job_id)
+            return dict(cached)
+            
+        job_data = await self._db(db_manager.get_job_status, job_id)
         if not job_data:
             return None
             
         is_running = job_id in self.active_jobs
         
-        return {
+        status = {
             'job_id': job_data.job_id,
             'platform': job_data.platform,
             'target': job_data.target,
@@ -363,95 +793,14 @@ class EnhancedScraperManager:
             'errors': job_data.errors
         }
         
-    async def stop_job(self, job_id: str) -> bool:
-        """Stop a running scraping job."""
-        if job_id not in self.active_jobs:
-            logger.warning(f"Job {job_id} is not running")
-            return False
-            
-        task = self.active_jobs[job_id]
-        task.cancel()
-        
-        try:
-            await task
-        except asyncio.CancelledError:
-            pass
-            
-        del self.active_jobs[job_id]
-        
-        # Update job status in database
-        db_manager.update_job_status(job_id, "cancelled", completed_at=datetime.utcnow())
-        
-        logger.info(f"Stopped scraping job {job_id}")
-        return True
-        
-    async def list_active_jobs(self) -> List[str]:
-        """List all currently active job IDs."""
-        return list(self.active_jobs.keys())
-        for job_id, task in self.active_jobs.items():
-            if not task.done():
-                logger.info(f"Cancelling active job {job_id}")
-                task.cancel()
-                
-    async def create_job(
-        self,
-        platform: Platform,
-        target: str,
-        max_posts: int = 100,
-        include_comments: bool = False,
-        keywords: Optional[List[str]] = None
-    ) -> str:
-        """Create a new scraping job."""
-        job_id = str(uuid.uuid4())
-        
-        job = ScrapingJob(
-            job_id=job_id,
-            platform=platform,
-            target=target,
-            max_posts=max_posts,
-            include_comments=include_comments,
-            keywords=keywords or []
-        )
-        
-        # Save job to database
-        db_manager.save_job(job.dict())
-        
-        logger.info(f"Created scraping job {job_id} for {platform.value} target '{target}'")
-        return job_id
-        
-    async def start_job(self, job_id: str) -> bool:
-        """Start a scraping job."""
-        if job_id in self.active_jobs:
-            logger.warning(f"Job {job_id} is already running")
-            return False
-            
-        # Get job from database
-        job_data = db_manager.get_job_status(job_id)
-        if not job_data:
-            logger.error(f"Job {job_id} not found")
-            return False
-            
-        job = ScrapingJob(
-            job_id=job_data.job_id,
-            platform=Platform(job_data.platform),
-            target=job_data.target,
-            max_posts=job_data.max_posts,
-            include_comments=job_data.include_comments,
-            keywords=job_data.keywords or []
-        )
-        
-        # Get appropriate scraper
-        scraper = self.scrapers.get(job.platform)
-        if not scraper:
-            logger.error(f"No scraper available for platform {job.platform.value}")
-            return False
+        # A finished job never changes again, so polls can skip the database
+        if status['status'] in TERMINAL_JOB_STATUSES and not is_running:
+            self._status_cache[job_id] = status
+            while len(self._status_cache) > STATUS_CACHE_MAX_ENTRIES:
+                self._status_cache.popitem(last=False)
+            return dict(status)
             
-        # Start job as background task
-        task = asyncio.create_task(scraper.run_scraping_job(job))
-        self.active_jobs[job_id] = task
-        
-        logger.info(f"Started scraping job {job_id}")
-        return True
+        return status
         
     async def stop_job(self, job_id: str) -> bool:
         """Stop a running scraping job."""
@@ -467,58 +816,16 @@ class EnhancedScraperManager:
         except asyncio.CancelledError:
             pass
             
-        del self.active_jobs[job_id]
-        
         # Update job status in database
-        db_manager.update_job_status(job_id, "cancelled", completed_at=datetime.utcnow())
+        self._status_cache.pop(job_id, None)
+        await self._db(db_manager.update_job_status, job_id, "cancelled", completed_at=datetime.utcnow())
         
         logger.info(f"Stopped scraping job {job_id}")
         return True
         
-    async def get_job_status(self, job_id: str) -> Optional[Dict]:
-        """Get the status of a scraping job."""
-        job_data = db_manager.get_job_status(job_id)
-        if not job_data:
-            return None
-            
-        is_running = job_id in self.active_jobs
-        
-        return {
-            'job_id': job_data.job_id,
-            'platform': job_data.platform,
-            'target': job_data.target,
-            'status': job_data.status,
-            'is_running': is_running,
-            'created_at': job_data.created_at,
-            'started_at': job_data.started_at,
-            'completed_at': job_data.completed_at,
-            'posts_scraped': job_data.posts_scraped,
-            'comments_scraped': job_data.comments_scraped,
-            'success': job_data.success,
-            'errors': job_data.errors
-        }
-        
     async def list_active_jobs(self) -> List[str]:
         """List all currently active job IDs."""
-        return list(self.active_jobs.keys())
-        
-    async def scrape_reddit_subreddit(
-        self,
-        subreddit: str,
-        max_posts: int = 100,
-        include_comments: bool = False,
-        sort: str = "hot"
-    ) -> str:
-        """Convenience method to scrape a Reddit subreddit."""
-        job_id = await self.create_job(
-            platform=Platform.REDDIT,
-            target=subreddit,
-            max_posts=max_posts,
-            include_comments=include_comments
-        )
-        
-        await self.start_job(job_id)
-        return job_id
+        return [job_id for job_id, task in self.active_jobs.items() if not task.done()]
         
     async def scrape_twitter_user(
         self,
@@ -527,19 +834,13 @@ class EnhancedScraperManager:
         include_comments: bool = False
     ) -> str:
         """Convenience method to scrape a Twitter user."""
-        if not username.startswith('@'):
-            username = f"@{username}"
-            
-        job_id = await self.create_job(
+        return await self.create_job(
             platform=Platform.TWITTER,
-            target=username,
+            target=_normalize_target(Platform.TWITTER, username),
             max_posts=max_posts,
             include_comments=include_comments
         )
         
-        await self.start_job(job_id)
-        return job_id
-        
     async def search_twitter(
         self,
         query: str,
@@ -547,7 +848,7 @@ class EnhancedScraperManager:
         keywords: Optional[List[str]] = None
     ) -> str:
         """Convenience method to search Twitter."""
-        job_id = await self.create_job(
+        return await self.create_job(
             platform=Platform.TWITTER,
             target=query,
             max_posts=max_posts,
@@ -555,21 +856,30 @@ class EnhancedScraperManager:
             keywords=keywords
         )
         
-        await self.start_job(job_id)
-        return job_id
-        
     async def health_check(self) -> Dict[str, bool]:
         """Perform health check on all scrapers."""
         results = {}
         
-        for platform, scraper in self.scrapers.items():
-            try:
-                is_healthy = await scraper.health_check()
-                results[platform.value] = is_healthy
-            except Exception as e:
-                logger.error(f"Health check failed for {platform.value}: {str(e)}")
-                results[platform.value] = False
+        for platform, strategies in self.strategies.items():
+            for strategy, scraper in strategies.items():
+                name = f"{platform.value} ({strategy.value})"
                 
+                # A recent pass is trusted; failures are always probed again
+                if self._healthy_until.get(name, 0.0) > time.monotonic():
+                    results[name] = True
+                    continue
+                    
+                try:
+                    results[name] = await scraper.health_check()
+                except Exception as e:
+                    logger.error(f"Health check failed for {name}: {str(e)}")
+                    results[name] = False
+                    
+                if results[name]:
+                    self._healthy_until[name] = time.monotonic() + HEALTH_CHECK_TTL
+                else:
+                    self._healthy_until.pop(name, None)
+                    
         return results
         
     async def get_scraped_posts(
@@ -580,60 +890,70 @@ class EnhancedScraperManager:
         subreddit: Optional[str] = None
     ) -> List[Dict]:
         """Get scraped posts from database with optional filters."""
-        with db_manager.get_session() as db:
-            from ..database import ScrapedPostDB
-            
-            query = db.query(ScrapedPostDB)
-            
-            if platform:
-                query = query.filter(ScrapedPostDB.platform == platform.value)
+        def fetch():
+            with db_manager.get_session() as db:
+                from sqlalchemy import func
+                from ..database import ScrapedPostDB
                 
-            if author:
-                query = query.filter(ScrapedPostDB.author == author)
+                # Only the listed columns, and at most 201 characters of content:
+                # enough to know whether it needs the ellipsis
+                query = db.query(
+                    ScrapedPostDB.id,
+                    ScrapedPostDB.platform,
+                    ScrapedPostDB.post_type,
+                    ScrapedPostDB.author,
+                    func.substr(ScrapedPostDB.content, 1, 201).label('content'),
+                    ScrapedPostDB.url,
+                    ScrapedPostDB.created_at,
+                    ScrapedPostDB.scraped_at,
+                    ScrapedPostDB.score,
+                    ScrapedPostDB.likes,
+                    ScrapedPostDB.retweets,
+                    ScrapedPostDB.replies,
+                    ScrapedPostDB.subreddit,
+                    ScrapedPostDB.hashtags,
+                    ScrapedPostDB.mentions,
+                )
+                
+                if platform:
+                    query = query.filter(ScrapedPostDB.platform == platform.value)
+                    
+                if author:
+                    query = query.filter(ScrapedPostDB.author == author)
+                    
+                if subreddit:
+                    query = query.filter(ScrapedPostDB.subreddit == subreddit)
+                    
+                query = query.order_by(ScrapedPostDB.scraped_at.desc()).limit(limit)
                 
-            if subreddit:
-                query = query.filter(ScrapedPostDB.subreddit == subreddit)
+                posts = []
+                for row in query.yield_per(100):
+                    post = row._asdict()
+                    if len(post['content']) > 200:
+                        post['content'] = post['content'][:200] + '...'
+                    posts.append(post)
+                return posts
                 
-            posts = query.order_by(ScrapedPostDB.scraped_at.desc()).limit(limit).all()
-            
-            return [
-                {
-                    'id': post.id,
-                    'platform': post.platform,
-                    'post_type': post.post_type,
-                    'author': post.author,
-                    'content': post.content[:200] + '...' if len(post.content) > 200 else post.content,
-                    'url': post.url,
-                    'created_at': post.created_at,
-                    'scraped_at': post.scraped_at,
-                    'score': post.score,
-                    'likes': post.likes,
-                    'retweets': post.retweets,
-                    'replies': post.replies,
-                    'subreddit': post.subreddit,
-                    'hashtags': post.hashtags,
-                    'mentions': post.mentions
-                }
-                for post in posts
-            ]
-            
+        return await self._db(fetch)
+        
     async def cleanup_old_jobs(self, days: int = 7):
         """Clean up old completed jobs from database."""
         cutoff_date = datetime.utcnow() - timedelta(days=days)
         
-        with db_manager.get_session() as db:
-            from ..database import ScrapingJobDB
+        def cleanup():
+            with db_manager.get_session() as db:
+                from ..database import ScrapingJobDB
             
-            old_jobs = db.query(ScrapingJobDB).filter(
-                ScrapingJobDB.completed_at < cutoff_date,
-                ScrapingJobDB.status.in_(['completed', 'failed', 'cancelled'])
-            ).all()
-            
-            for job in old_jobs:
-                db.delete(job)
+                # One DELETE statement; the rows are never loaded
+                deleted = db.query(ScrapingJobDB).filter(
+                    ScrapingJobDB.completed_at < cutoff_date,
+                    ScrapingJobDB.status.in_(['completed', 'failed', 'cancelled'])
+                ).delete(synchronize_session=False)
+                
+                db.commit()
+                logger.info(f"Cleaned up {deleted} old jobs")
                 
-            db.commit()
-            logger.info(f"Cleaned up {len(old_jobs)} old jobs")
+        await self._db(cleanup)
 
 
 # Global scraper manager instance
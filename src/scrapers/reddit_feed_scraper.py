@@ -2,16 +2,99 @@
 Reddit RSS feed scraper implementation.
 """
 import asyncio
-import feedparser
-from typing import AsyncGenerator, Dict, List, Any, Optional
-from datetime import datetime
+from dataclasses import dataclass
+from typing import AsyncGenerator, Dict, Iterator, List, Any, Mapping, Optional, Tuple
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from hashlib import sha1
+from types import MappingProxyType
 from loguru import logger
+from lxml import etree
 import re
 from urllib.parse import urljoin
 
 from ..models import RedditPost, Platform, PostType, ScrapingStrategy
 from ..config import settings
-from .base import BaseScraper
+from .base import BaseScraper, scan_tags
+
+# Compiled once; these run on every feed entry
+_AUTHOR_RE = re.compile(r'by u/(\w+)')
+# Trailing "by u/username in r/subreddit" on feed titles; group 1 is the author
+_TITLE_SUFFIX_RE = re.compile(r'\s+by u/(\w+) in r/\w+$')
+# Hashtags and mentions in one pass: group 1 is a hashtag, group 2 a mentioned user
+_TAGS_RE = re.compile(r'(#\w+)|/u/(\w+)')
+_TAG_MARKERS = ('#', '/u/')
+_SUB_IN_TITLE_RE = re.compile(r'in r/(\w+)')
+_SUB_IN_LINK_RE = re.compile(r'/r/(\w+)/')
+
+# Reddit's .rss endpoints serve Atom
+_ATOM = '{http://www.w3.org/2005/Atom}'
+
+# Bytes handed to the XML parser at a time while a feed downloads
+_FEED_CHUNK_SIZE = 64 * 1024
+
+# Feed path per sort order; anything else falls back to hot
+_RSS_URL_TEMPLATES = {
+    'hot': '/r/{t}.rss',
+    'new': '/r/{t}/new.rss',
+    'top': '/r/{t}/top.rss',
+    'rising': '/r/{t}/rising.rss',
+}
+
+_FEED_TYPES = (
+    MappingProxyType({"name": "Hot Posts", "url_suffix": ".rss", "description": "Hot posts from subreddit"}),
+    MappingProxyType({"name": "New Posts", "url_suffix": "/new.rss", "description": "Newest posts from subreddit"}),
+    MappingProxyType({"name": "Top Posts", "url_suffix": "/top.rss", "description": "Top posts from subreddit"}),
+    MappingProxyType({"name": "Rising Posts", "url_suffix": "/rising.rss", "description": "Rising posts from subreddit"}),
+)
+
+
+@dataclass
+class _AtomEntry:
+    """The fields of an Atom <entry> the scraper reads; slotted, so no per-entry dict."""
+    __slots__ = ('title', 'link', 'summary', 'published', 'id')
+    
+    title: str
+    link: str
+    summary: str
+    published: str
+    id: str
+
+
+def _parse_published(value: str) -> Optional[datetime]:
+    """Parse an Atom (ISO 8601) or RSS (RFC 822) date as naive UTC."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        try:
+            parsed = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _read_atom_entries(parser: etree.XMLPullParser) -> Iterator[_AtomEntry]:
+    """Yield the Atom entries parsed so far, freeing each element once it is read."""
+    for _, element in parser.read_events():
+        link = element.find(f'{_ATOM}link')
+        published = element.findtext(f'{_ATOM}published') or element.findtext(f'{_ATOM}updated') or ''
+        
+        yield _AtomEntry(
+            title=element.findtext(f'{_ATOM}title') or '',
+            link=link.get('href', '') if link is not None else '',
+            summary=element.findtext(f'{_ATOM}summary') or element.findtext(f'{_ATOM}content') or '',
+            published=published,
+            id=element.findtext(f'{_ATOM}id') or '',
+        )
+        
+        # Keep memory flat: drop this entry and the siblings already processed
+        element.clear()
+        while element.getprevious() is not None:
+            del element.getparent()[0]
 
 
 class RedditFeedScraper(BaseScraper):
@@ -20,7 +103,75 @@ class RedditFeedScraper(BaseScraper):
     def __init__(self):
         super().__init__(Platform.REDDIT, ScrapingStrategy.FEED)
         self.base_url = "https://www.reddit.com"
+        # url -> (ETag, Last-Modified, entries read then (None if the whole feed), those entries)
+        self._feed_validators: Dict[
+            str, Tuple[Optional[str], Optional[str], Optional[int], Tuple[_AtomEntry, ...]]
+        ] = {}
         
+    async def _iter_feed(self, url: str, max_entries: int) -> AsyncGenerator[_AtomEntry, None]:
+        """
+        Parse Atom entries while the feed downloads, stopping after max_entries.
+        
+        Feeds are fetched conditionally; a 304 Not Modified replays the
+        entries kept from the fetch that set the validators.
+        """
+        if max_entries <= 0:
+            return
+            
+        # Only revalidate if the earlier fetch read at least as many entries
+        headers = {}
+        etag, last_modified, covered, cached = self._feed_validators.get(url, (None, None, 0, ()))
+        if covered is None or covered >= max_entries:
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+                
+        response = await self._open_response(url, headers=headers)
+        
+        try:
+            if response.status == 304:
+                logger.debug(f"Feed not modified since last fetch: {url}")
+                for entry in cached[:max_entries]:
+                    yield entry
+                return
+                
+            # lxml decodes the raw bytes itself, from the XML declaration
+            parser = etree.XMLPullParser(events=('end',), tag=f'{_ATOM}entry', resolve_entities=False)
+            entries: List[_AtomEntry] = []
+            stopped = False
+            
+            async for chunk in response.content.iter_chunked(_FEED_CHUNK_SIZE):
+                parser.feed(chunk)
+                for entry in _read_atom_entries(parser):
+                    yield entry
+                    entries.append(entry)
+                    if len(entries) >= max_entries:
+                        stopped = True
+                        break
+                if stopped:
+                    break
+                    
+            if not stopped:
+                parser.close()
+                for entry in _read_atom_entries(parser):
+                    yield entry
+                    entries.append(entry)
+                    if len(entries) >= max_entries:
+                        stopped = True
+                        break
+                        
+            # Remember the validators, and the entries a 304 will stand for,
+            # only once the feed was read without error
+            etag, last_modified = response.headers.get('ETag'), response.headers.get('Last-Modified')
+            if etag or last_modified:
+                self._feed_validators[url] = (
+                    etag, last_modified, max_entries if stopped else None, tuple(entries)
+                )
+        finally:
+            # Stopping early closes the connection instead of draining the body
+            response.release()
+            
     async def scrape_posts(
         self, 
         target: str, 
@@ -40,50 +191,65 @@ class RedditFeedScraper(BaseScraper):
         logger.info(f"RSS scraping r/{target} - {sort} posts (max: {max_posts})")
         
         # Build RSS URL
-        if sort == "new":
-            rss_url = f"{self.base_url}/r/{target}/new.rss"
-        elif sort == "top":
-            rss_url = f"{self.base_url}/r/{target}/top.rss"
-        elif sort == "rising":
-            rss_url = f"{self.base_url}/r/{target}/rising.rss"
-        else:  # default to hot
-            rss_url = f"{self.base_url}/r/{target}.rss"
+        template = _RSS_URL_TEMPLATES.get(sort, _RSS_URL_TEMPLATES['hot'])
+        rss_url = f"{self.base_url}{template.format(t=target)}"
             
         try:
-            # Make request to get RSS content
-            response = await self._make_request(rss_url)
+            posts_yielded = 0
             
-            if 'text' in response:
-                # Parse RSS feed
-                feed = feedparser.parse(response['text'])
-                
-                if feed.bozo:
-                    logger.warning(f"RSS feed parsing warning for r/{target}: {feed.bozo_exception}")
-                
-                posts_yielded = 0
-                
-                for entry in feed.entries[:max_posts]:
+            try:
+                # Parse only as many entries as we need, as the feed arrives
+                async for entry in self._iter_feed(rss_url, max_posts):
                     try:
                         post = self._convert_rss_entry_to_post(entry, target)
                         yield post
                         posts_yielded += 1
                         
-                        # Respectful delay
-                        await asyncio.sleep(settings.min_request_delay)
-                        
                     except Exception as e:
                         logger.error(f"Error processing RSS entry: {str(e)}")
                         continue
-                        
-                logger.info(f"Successfully scraped {posts_yielded} posts from r/{target} RSS")
+            except etree.XMLSyntaxError as e:
+                logger.warning(f"RSS feed parsing warning for r/{target}: {e}")
                 
-            else:
-                logger.warning(f"No RSS content found for r/{target}")
+            logger.info(f"Successfully scraped {posts_yielded} posts from r/{target} RSS")
                 
         except Exception as e:
             logger.error(f"Error scraping RSS for r/{target}: {str(e)}")
             raise
             
+    async def scrape_many(
+        self,
+        targets: List[str],
+        max_posts: int = 100,
+        sort: str = "hot"
+    ) -> AsyncGenerator[Tuple[str, List[RedditPost]], None]:
+        """
+        Scrape several subreddit feeds concurrently.
+        
+        Yields (target, posts) as each feed finishes; at most
+        settings.max_concurrent_feeds feeds are fetched at once.
+        """
+        semaphore = asyncio.Semaphore(settings.max_concurrent_feeds)
+        
+        async def scrape_one(target: str) -> Tuple[str, List[RedditPost]]:
+            async with semaphore:
+                try:
+                    return target, [post async for post in self.scrape_posts(target, max_posts, sort=sort)]
+                except Exception as e:
+                    logger.error(f"Error scraping RSS for r/{target}: {str(e)}")
+                    return target, []
+                    
+        tasks = [asyncio.create_task(scrape_one(target)) for target in dict.fromkeys(targets)]
+        
+        try:
+            for finished in asyncio.as_completed(tasks):
+                yield await finished
+        finally:
+            # The caller may stop early; don't leave feeds downloading
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            
     async def scrape_search(
         self, 
         query: str, 
@@ -108,17 +274,6 @@ class RedditFeedScraper(BaseScraper):
         return
         yield  # Make this a generator
             
-    async def scrape_comments(
-        self, 
-        post_url: str, 
-        max_comments: int = 100
-    ) -> AsyncGenerator[RedditPost, None]:
-        """RSS feeds don't support comment scraping - return empty results."""
-        logger.warning("RSS feeds don't support comment scraping. Consider using web scraping strategy.")
-        # RSS doesn't support comment scraping, so we'll return empty results
-        return
-        yield  # Make this a generator
-        
     async def scrape_user_posts(
         self, 
         username: str, 
@@ -130,14 +285,10 @@ class RedditFeedScraper(BaseScraper):
         rss_url = f"{self.base_url}/u/{username}.rss"
         
         try:
-            response = await self._make_request(rss_url)
+            posts_yielded = 0
             
-            if 'text' in response:
-                feed = feedparser.parse(response['text'])
-                
-                posts_yielded = 0
-                
-                for entry in feed.entries[:max_posts]:
+            try:
+                async for entry in self._iter_feed(rss_url, max_posts):
                     try:
                         # Extract subreddit from the entry
                         subreddit = self._extract_subreddit_from_entry(entry)
@@ -145,13 +296,13 @@ class RedditFeedScraper(BaseScraper):
                         yield post
                         posts_yielded += 1
                         
-                        await asyncio.sleep(settings.min_request_delay)
-                        
                     except Exception as e:
                         logger.error(f"Error processing user RSS entry: {str(e)}")
                         continue
-                        
-                logger.info(f"Successfully scraped {posts_yielded} posts from u/{username}")
+            except etree.XMLSyntaxError as e:
+                logger.warning(f"RSS feed parsing warning for u/{username}: {e}")
+                
+            logger.info(f"Successfully scraped {posts_yielded} posts from u/{username}")
                 
         except Exception as e:
             logger.error(f"Error scraping RSS for u/{username}: {str(e)}")
@@ -159,7 +310,7 @@ class RedditFeedScraper(BaseScraper):
             
     def _convert_rss_entry_to_post(
         self, 
-        entry: Any, 
+        entry: _AtomEntry, 
         subreddit: str, 
         author: Optional[str] = None
     ) -> RedditPost:
@@ -170,31 +321,29 @@ class RedditFeedScraper(BaseScraper):
         
         # Parse the entry content
         title = entry.title
-        content = getattr(entry, 'summary', '')
+        content = entry.summary
+        
+        # RSS titles often have format: "Title by u/username in r/subreddit";
+        # one match gives both the author and the clean title
+        suffix = _TITLE_SUFFIX_RE.search(title)
+        clean_title = title[:suffix.start()] if suffix else title
         
         # Extract author from title if not provided
         if not author:
-            # RSS titles often have format: "Title by u/username in r/subreddit"
-            author_match = re.search(r'by u/(\w+)', title)
+            author_match = suffix or _AUTHOR_RE.search(title)
             author = author_match.group(1) if author_match else 'unknown'
-            
-        # Clean up title (remove "by u/username in r/subreddit" part)
-        clean_title = re.sub(r'\s+by u/\w+ in r/\w+$', '', title)
         
-        # Extract hashtags and mentions
-        combined_text = f"{clean_title} {content}"
-        hashtags = re.findall(r'#\w+', combined_text)
-        mentions = re.findall(r'/u/(\w+)', combined_text)
+        # Extract hashtags and mentions from each field in place
+        hashtags: List[str] = []
+        mentions: List[str] = []
+        scan_tags(clean_title, _TAGS_RE, _TAG_MARKERS, hashtags, mentions)
+        scan_tags(content, _TAGS_RE, _TAG_MARKERS, hashtags, mentions)
         
         # Parse publication date
-        created_at = datetime.now()
-        if hasattr(entry, 'published_parsed') and entry.published_parsed:
-            try:
-                created_at = datetime(*entry.published_parsed[:6])
-            except (TypeError, ValueError):
-                pass
+        created_at = _parse_published(entry.published) or datetime.now()
                 
-        return RedditPost(
+        # Every field is computed above with its final type; skip re-validation
+        return RedditPost.model_construct(
             id=post_id,
             post_type=PostType.POST,
             author=author,
@@ -220,48 +369,53 @@ class RedditFeedScraper(BaseScraper):
             stickied=False,
             locked=False,
             
-            raw_data={
-                'rss_entry': {
-                    'title': entry.title,
-                    'link': entry.link,
-                    'summary': getattr(entry, 'summary', ''),
-                    'published': getattr(entry, 'published', ''),
-                    'id': getattr(entry, 'id', ''),
-                }
-            }
+            # Raw data is only built when it will be stored
+            raw_data=self._entry_raw_data(entry) if settings.store_raw_data else {}
         )
         
+    def _entry_raw_data(self, entry: _AtomEntry) -> Dict[str, Any]:
+        """Raw fields of a feed entry, kept when STORE_RAW_DATA is on."""
+        return {
+            'rss_entry': {
+                'title': entry.title,
+                'link': entry.link,
+                'summary': entry.summary,
+                'published': entry.published,
+                'id': entry.id,
+            }
+        }
+        
     def _extract_post_id_from_url(self, url: str) -> str:
-        """Extract Reddit post ID from URL."""
+        """Extract Reddit post ID from URL; fallback ids are stable across processes."""
         # Reddit URLs have format: https://www.reddit.com/r/subreddit/comments/POST_ID/title/
-        id_match = re.search(r'/comments/([a-zA-Z0-9]+)/', url)
-        if id_match:
-            return id_match.group(1)
+        start = url.find('/comments/')
+        if start >= 0:
+            start += len('/comments/')
+            end = url.find('/', start)
+            post_id = url[start:end] if end >= 0 else url[start:]
+            if post_id:
+                return post_id
         
-        # Fallback: use the last part of the URL or generate a hash
-        return url.split('/')[-1] or str(hash(url))[-8:]
+        # Fallback: use the last part of the URL or a hash of it. hash() is
+        # salted per process, so the same URL would get a new id every run
+        return url.split('/')[-1] or sha1(url.encode('utf-8'), usedforsecurity=False).hexdigest()[:12]
         
-    def _extract_subreddit_from_entry(self, entry: Any) -> str:
+    def _extract_subreddit_from_entry(self, entry: _AtomEntry) -> str:
         """Extract subreddit name from RSS entry."""
         # Try to extract from title first
         title = entry.title
-        subreddit_match = re.search(r'in r/(\w+)', title)
+        subreddit_match = _SUB_IN_TITLE_RE.search(title)
         if subreddit_match:
             return subreddit_match.group(1)
             
         # Try to extract from link
         link = entry.link
-        link_match = re.search(r'/r/(\w+)/', link)
+        link_match = _SUB_IN_LINK_RE.search(link)
         if link_match:
             return link_match.group(1)
             
         return 'unknown'
         
-    async def get_available_feeds(self) -> List[Dict[str, str]]:
-        """Get list of available RSS feed types."""
-        return [
-            {"name": "Hot Posts", "url_suffix": ".rss", "description": "Hot posts from subreddit"},
-            {"name": "New Posts", "url_suffix": "/new.rss", "description": "Newest posts from subreddit"},
-            {"name": "Top Posts", "url_suffix": "/top.rss", "description": "Top posts from subreddit"},
-            {"name": "Rising Posts", "url_suffix": "/rising.rss", "description": "Rising posts from subreddit"},
-        ]
+    async def get_available_feeds(self) -> Tuple[Mapping[str, str], ...]:
+        """Get the available RSS feed types (shared and read-only)."""
+        return _FEED_TYPES
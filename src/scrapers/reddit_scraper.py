@@ -3,14 +3,33 @@ Reddit scraper implementation.
 """
 import asyncio
 import praw
-from typing import AsyncGenerator, Dict, List, Any, Optional
-from datetime import datetime
+from typing import AsyncGenerator, Callable, Dict, List, Any, Optional, Tuple
 from loguru import logger
 import re
 
 from ..models import RedditPost, Platform, PostType, ScrapingStrategy
 from ..config import settings
-from .base import BaseScraper
+from .base import BaseScraper, from_utc_timestamp, scan_tags
+
+# Hashtags and mentions in one pass: group 1 is a hashtag, group 2 a mention
+_TAGS_RE = re.compile(r'(#\w+)|(u/\w+)')
+_TAG_MARKERS = ('#', 'u/')
+
+# Listing per sort order, called as (listing owner, limit, time_filter)
+_SUBREDDIT_SORTS = {
+    'hot': lambda s, n, t: s.hot(limit=n),
+    'new': lambda s, n, t: s.new(limit=n),
+    'top': lambda s, n, t: s.top(time_filter=t, limit=n),
+    'rising': lambda s, n, t: s.rising(limit=n),
+}
+_USER_SORTS = {
+    'new': lambda s, n: s.new(limit=n),
+    'top': lambda s, n: s.top(limit=n),
+    'hot': lambda s, n: s.hot(limit=n),
+}
+
+# Image links are recognised by the extension at the end of the URL path
+_IMAGE_SUFFIXES = ('.jpg', '.jpeg', '.png', '.gif', '.webp', '.JPG', '.JPEG', '.PNG', '.GIF', '.WEBP')
 
 
 class RedditScraper(BaseScraper):
@@ -19,6 +38,8 @@ class RedditScraper(BaseScraper):
     def __init__(self):
         super().__init__(Platform.REDDIT, ScrapingStrategy.API)
         self.reddit = None
+        # praw.Reddit is not thread-safe, so worker-thread calls on it take turns
+        self._praw_lock = asyncio.Lock()
         self._setup_reddit_client()
         
     def _setup_reddit_client(self):
@@ -58,18 +79,12 @@ class RedditScraper(BaseScraper):
             subreddit = self.reddit.subreddit(target)
             logger.info(f"Scraping r/{target} - {sort} posts (max: {max_posts})")
             
-            # Get posts based on sort method
-            if sort == "hot":
-                submissions = subreddit.hot(limit=max_posts)
-            elif sort == "new":
-                submissions = subreddit.new(limit=max_posts)
-            elif sort == "top":
-                submissions = subreddit.top(time_filter=time_filter, limit=max_posts)
-            elif sort == "rising":
-                submissions = subreddit.rising(limit=max_posts)
-            else:
-                submissions = subreddit.hot(limit=max_posts)
+            # Get posts based on sort method, defaulting to hot
+            listing = _SUBREDDIT_SORTS.get(sort, _SUBREDDIT_SORTS['hot'])
+            submissions = listing(subreddit, max_posts, time_filter)
                 
+            # PRAW uses blocking requests; fetch the listing off the event loop
+            submissions = await self._run_praw(list, submissions)
             posts_yielded = 0
             
             for submission in submissions:
@@ -81,9 +96,6 @@ class RedditScraper(BaseScraper):
                     yield post
                     posts_yielded += 1
                     
-                    # Add small delay to avoid overwhelming
-                    await asyncio.sleep(0.1)
-                    
                 except Exception as e:
                     logger.error(f"Error processing submission {submission.id}: {str(e)}")
                     continue
@@ -103,13 +115,13 @@ class RedditScraper(BaseScraper):
             
         try:
             submission = self.reddit.submission(id=post_id)
-            submission.comments.replace_more(limit=0)  # Remove "more comments" objects
-            
             logger.info(f"Scraping comments for post {post_id} (max: {max_comments})")
             
+            # Fetching the comment tree blocks, so it runs in a worker thread
+            comments = await self._run_praw(self._load_comments, submission)
             comments_yielded = 0
             
-            for comment in submission.comments.list():
+            for comment in comments:
                 if comments_yielded >= max_comments:
                     break
                     
@@ -127,25 +139,35 @@ class RedditScraper(BaseScraper):
             logger.error(f"Error scraping comments for post {post_id}: {str(e)}")
             raise
             
+    async def _run_praw(self, fn: Callable, *args) -> Any:
+        """Run a blocking PRAW call on a worker thread, one call at a time."""
+        async with self._praw_lock:
+            return await asyncio.to_thread(fn, *args)
+            
+    def _load_comments(self, submission) -> List[Any]:
+        """Fetch a submission's full comment tree as a flat list (blocking)."""
+        submission.comments.replace_more(limit=0)  # Remove "more comments" objects
+        return submission.comments.list()
+        
     async def _convert_submission_to_post(self, submission) -> RedditPost:
         """Convert Reddit submission to RedditPost model."""
         # Extract hashtags and mentions
-        hashtags = self._extract_hashtags(submission.title + " " + (submission.selftext or ""))
-        mentions = self._extract_mentions(submission.title + " " + (submission.selftext or ""))
+        hashtags, mentions = self._extract_tags(submission.title, submission.selftext)
         
         # Extract media URLs
         media_urls = []
-        if hasattr(submission, 'url') and submission.url:
-            if any(ext in submission.url.lower() for ext in ['.jpg', '.jpeg', '.png', '.gif', '.webp']):
-                media_urls.append(submission.url)
+        url = getattr(submission, 'url', None)
+        if url and url.partition('?')[0].endswith(_IMAGE_SUFFIXES):
+            media_urls.append(url)
                 
-        return RedditPost(
+        # PRAW attributes already carry the model's types; skip re-validation
+        return RedditPost.model_construct(
             id=submission.id,
             post_type=PostType.POST,
             author=str(submission.author) if submission.author else "[deleted]",
             content=submission.title,
             url=f"https://reddit.com{submission.permalink}",
-            created_at=datetime.fromtimestamp(submission.created_utc),
+            created_at=from_utc_timestamp(submission.created_utc),
             
             # Engagement metrics
             upvotes=submission.ups if hasattr(submission, 'ups') else 0,
@@ -169,31 +191,34 @@ class RedditScraper(BaseScraper):
             mentions=mentions,
             media_urls=media_urls,
             
-            # Raw data
-            raw_data={
-                'title': submission.title,
-                'selftext': submission.selftext,
-                'domain': submission.domain,
-                'url': submission.url,
-                'thumbnail': getattr(submission, 'thumbnail', None),
-                'gilded': getattr(submission, 'gilded', 0),
-                'distinguished': getattr(submission, 'distinguished', None),
-            }
+            # Raw data is only built when it will be stored
+            raw_data=self._submission_raw_data(submission) if settings.store_raw_data else {}
         )
         
+    def _submission_raw_data(self, submission) -> Dict[str, Any]:
+        """Raw fields of a submission, kept when STORE_RAW_DATA is on."""
+        return {
+            'title': submission.title,
+            'selftext': submission.selftext,
+            'domain': submission.domain,
+            'url': submission.url,
+            'thumbnail': getattr(submission, 'thumbnail', None),
+            'gilded': getattr(submission, 'gilded', 0),
+            'distinguished': getattr(submission, 'distinguished', None),
+        }
+        
     async def _convert_comment_to_post(self, comment, submission) -> RedditPost:
         """Convert Reddit comment to RedditPost model."""
         # Extract hashtags and mentions
-        hashtags = self._extract_hashtags(comment.body)
-        mentions = self._extract_mentions(comment.body)
+        hashtags, mentions = self._extract_tags(comment.body)
         
-        return RedditPost(
+        return RedditPost.model_construct(
             id=comment.id,
             post_type=PostType.COMMENT,
             author=str(comment.author) if comment.author else "[deleted]",
             content=comment.body,
             url=f"https://reddit.com{comment.permalink}",
-            created_at=datetime.fromtimestamp(comment.created_utc),
+            created_at=from_utc_timestamp(comment.created_utc),
             
             # Engagement metrics
             upvotes=comment.ups if hasattr(comment, 'ups') else 0,
@@ -212,27 +237,27 @@ class RedditScraper(BaseScraper):
             mentions=mentions,
             media_urls=[],
             
-            # Raw data
-            raw_data={
-                'parent_id': comment.parent_id,
-                'link_id': comment.link_id,
-                'depth': getattr(comment, 'depth', 0),
-                'gilded': getattr(comment, 'gilded', 0),
-                'distinguished': getattr(comment, 'distinguished', None),
-            }
+            # Raw data is only built when it will be stored
+            raw_data=self._comment_raw_data(comment) if settings.store_raw_data else {}
         )
         
-    def _extract_hashtags(self, text: str) -> List[str]:
-        """Extract hashtags from text."""
-        if not text:
-            return []
-        return re.findall(r'#\w+', text)
+    def _comment_raw_data(self, comment) -> Dict[str, Any]:
+        """Raw fields of a comment, kept when STORE_RAW_DATA is on."""
+        return {
+            'parent_id': comment.parent_id,
+            'link_id': comment.link_id,
+            'depth': getattr(comment, 'depth', 0),
+            'gilded': getattr(comment, 'gilded', 0),
+            'distinguished': getattr(comment, 'distinguished', None),
+        }
         
-    def _extract_mentions(self, text: str) -> List[str]:
-        """Extract user mentions from text."""
-        if not text:
-            return []
-        return re.findall(r'u/\w+', text)
+    def _extract_tags(self, *texts: Optional[str]) -> Tuple[List[str], List[str]]:
+        """Extract hashtags and user mentions from each text in a single scan."""
+        hashtags: List[str] = []
+        mentions: List[str] = []
+        for text in texts:
+            scan_tags(text, _TAGS_RE, _TAG_MARKERS, hashtags, mentions)
+        return hashtags, mentions
         
     async def search_posts(
         self, 
@@ -269,6 +294,7 @@ class RedditScraper(BaseScraper):
                 time_filter=time_filter,
                 limit=max_posts
             )
+            submissions = await self._run_praw(list, submissions)
             
             posts_yielded = 0
             
@@ -281,8 +307,6 @@ class RedditScraper(BaseScraper):
                     yield post
                     posts_yielded += 1
                     
-                    await asyncio.sleep(0.1)
-                    
                 except Exception as e:
                     logger.error(f"Error processing search result {submission.id}: {str(e)}")
                     continue
@@ -305,15 +329,10 @@ class RedditScraper(BaseScraper):
             user = self.reddit.redditor(username)
             logger.info(f"Scraping posts from u/{username}")
             
-            if sort == "new":
-                submissions = user.submissions.new(limit=max_posts)
-            elif sort == "top":
-                submissions = user.submissions.top(limit=max_posts)
-            elif sort == "hot":
-                submissions = user.submissions.hot(limit=max_posts)
-            else:
-                submissions = user.submissions.new(limit=max_posts)
+            listing = _USER_SORTS.get(sort, _USER_SORTS['new'])
+            submissions = listing(user.submissions, max_posts)
                 
+            submissions = await self._run_praw(list, submissions)
             posts_yielded = 0
             
             for submission in submissions:
@@ -325,8 +344,6 @@ class RedditScraper(BaseScraper):
                     yield post
                     posts_yielded += 1
                     
-                    await asyncio.sleep(0.1)
-                    
                 except Exception as e:
                     logger.error(f"Error processing user post {submission.id}: {str(e)}")
                     continue
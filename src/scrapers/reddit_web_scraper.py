@@ -4,15 +4,18 @@ Reddit web scraper implementation - no API credentials required.
 import asyncio
 import json
 import re
-from typing import AsyncGenerator, Dict, List, Any, Optional
-from datetime import datetime
+from typing import AsyncGenerator, Dict, Iterator, List, Any, Optional
 from loguru import logger
 from urllib.parse import urljoin
 from bs4 import BeautifulSoup
 
 from ..models import RedditPost, Platform, PostType, ScrapingStrategy
 from ..config import settings
-from .base import BaseScraper
+from .base import BaseScraper, from_utc_timestamp, scan_tags
+
+# Hashtags and mentions in one pass: group 1 is a hashtag, group 2 a mentioned user
+_TAGS_RE = re.compile(r'(#\w+)|/u/(\w+)')
+_TAG_MARKERS = ('#', '/u/')
 
 
 class RedditWebScraper(BaseScraper):
@@ -22,6 +25,54 @@ class RedditWebScraper(BaseScraper):
         super().__init__(Platform.REDDIT, ScrapingStrategy.WEB)
         self.base_url = "https://www.reddit.com"
         
+    async def _iter_listing(
+        self, 
+        url: str, 
+        params: Dict[str, Any], 
+        max_items: int
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Yield the data of up to max_items listing children, following 'after' pages.
+        
+        The next page is requested before the current one is handed out, so
+        its round trip overlaps with converting and consuming this one.
+        """
+        response = await self._make_request(url, params={**params, "limit": min(100, max_items)})
+        yielded = 0
+        next_page = None
+        
+        try:
+            while True:
+                listing = response.get('data') or {}
+                children = listing.get('children') or []
+                after = listing.get('after')
+                
+                remaining = max_items - yielded - len(children)
+                if after and children and remaining > 0:
+                    next_params = {**params, "limit": min(100, remaining), "after": after}
+                    next_page = asyncio.create_task(self._make_request(url, params=next_params))
+                    
+                for item in children:
+                    if yielded >= max_items:
+                        break
+                    yield item['data']
+                    yielded += 1
+                    
+                if next_page is None:
+                    return
+                response = await next_page
+                next_page = None
+        finally:
+            # The consumer stopped early; don't leave a page downloading, and
+            # retrieve a prefetch failure so it isn't reported as never retrieved
+            if next_page is not None:
+                if next_page.done():
+                    if not next_page.cancelled():
+                        next_page.exception()
+                else:
+                    next_page.cancel()
+                    await asyncio.gather(next_page, return_exceptions=True)
+                
     async def scrape_posts(
         self, 
         target: str, 
@@ -41,40 +92,26 @@ class RedditWebScraper(BaseScraper):
         logger.info(f"Web scraping r/{target} - {sort} posts (max: {max_posts})")
         
         # Build URL for Reddit JSON endpoint
-        if sort == "top":
-            url = f"{self.base_url}/r/{target}/{sort}.json?t={time_filter}"
-        else:
-            url = f"{self.base_url}/r/{target}/{sort}.json"
-            
-        params = {"limit": min(100, max_posts)}
+        url = f"{self.base_url}/r/{target}/{sort}.json"
+        params = {"t": time_filter} if sort == "top" else {}
         
         try:
-            # Reddit's JSON endpoint doesn't require authentication
-            response = await self._make_request(url, params=params)
+            # Reddit's JSON endpoint doesn't require authentication; pages of
+            # up to 100 are followed until max_posts
+            posts_yielded = 0
             
-            if 'data' in response and 'children' in response['data']:
-                posts_yielded = 0
-                
-                for item in response['data']['children']:
-                    if posts_yielded >= max_posts:
-                        break
-                        
-                    post_data = item['data']
+            async for post_data in self._iter_listing(url, params, max_posts):
+                try:
+                    post = self._convert_json_to_post(post_data, target)
+                    yield post
+                    posts_yielded += 1
                     
-                    try:
-                        post = self._convert_json_to_post(post_data, target)
-                        yield post
-                        posts_yielded += 1
-                        
-                        # Respectful delay
-                        await asyncio.sleep(settings.min_request_delay)
-                        
-                    except Exception as e:
-                        logger.error(f"Error processing post {post_data.get('id', 'unknown')}: {str(e)}")
-                        continue
-                        
+                except Exception as e:
+                    logger.error(f"Error processing post {post_data.get('id', 'unknown')}: {str(e)}")
+                    continue
+                    
+            if posts_yielded:
                 logger.info(f"Successfully scraped {posts_yielded} posts from r/{target}")
-                
             else:
                 logger.warning(f"No data found for r/{target}")
                 
@@ -96,7 +133,6 @@ class RedditWebScraper(BaseScraper):
         params = {
             "q": query,
             "sort": sort,
-            "limit": min(100, max_posts),
             "type": "link"
         }
         
@@ -104,29 +140,19 @@ class RedditWebScraper(BaseScraper):
             params["q"] = f"subreddit:{subreddit} {query}"
             
         try:
-            response = await self._make_request(url, params=params)
+            posts_yielded = 0
             
-            if 'data' in response and 'children' in response['data']:
-                posts_yielded = 0
-                
-                for item in response['data']['children']:
-                    if posts_yielded >= max_posts:
-                        break
-                        
-                    post_data = item['data']
+            async for post_data in self._iter_listing(url, params, max_posts):
+                try:
+                    post = self._convert_json_to_post(post_data, post_data.get('subreddit', 'unknown'))
+                    yield post
+                    posts_yielded += 1
                     
-                    try:
-                        post = self._convert_json_to_post(post_data, post_data.get('subreddit', 'unknown'))
-                        yield post
-                        posts_yielded += 1
-                        
-                        await asyncio.sleep(settings.min_request_delay)
-                        
-                    except Exception as e:
-                        logger.error(f"Error processing search result {post_data.get('id', 'unknown')}: {str(e)}")
-                        continue
-                        
-                logger.info(f"Successfully scraped {posts_yielded} search results")
+                except Exception as e:
+                    logger.error(f"Error processing search result {post_data.get('id', 'unknown')}: {str(e)}")
+                    continue
+                    
+            logger.info(f"Successfully scraped {posts_yielded} search results")
                 
         except Exception as e:
             logger.error(f"Error searching Reddit for '{query}': {str(e)}")
@@ -155,8 +181,8 @@ class RedditWebScraper(BaseScraper):
                 if 'data' in comments_data and 'children' in comments_data['data']:
                     comments_yielded = 0
                     
-                    # Recursively process comment tree
-                    async for comment in self._process_comment_tree(
+                    # Walk the comment tree
+                    for comment in self._process_comment_tree(
                         comments_data['data']['children'], 
                         max_comments - comments_yielded
                     ):
@@ -166,93 +192,100 @@ class RedditWebScraper(BaseScraper):
                         if comments_yielded >= max_comments:
                             break
                             
-                        await asyncio.sleep(0.5)
-                        
                     logger.info(f"Successfully scraped {comments_yielded} comments")
                     
         except Exception as e:
             logger.error(f"Error scraping comments from {post_url}: {str(e)}")
             raise
             
-    async def _process_comment_tree(
+    def _process_comment_tree(
         self, 
         comments: List[Dict], 
         max_comments: int
-    ) -> AsyncGenerator[RedditPost, None]:
-        """Recursively process comment tree."""
+    ) -> Iterator[RedditPost]:
+        """Walk the comment tree depth-first, parents before their replies."""
         comments_processed = 0
+        # One iterator per open level of the thread, instead of one generator per recursion
+        stack = [iter(comments)]
         
-        for comment_item in comments:
-            if comments_processed >= max_comments:
-                break
+        while stack and comments_processed < max_comments:
+            comment_item = next(stack[-1], None)
+            if comment_item is None:
+                stack.pop()
+                continue
                 
-            if comment_item['kind'] == 't1':  # Comment
-                comment_data = comment_item['data']
+            if comment_item['kind'] != 't1':  # Not a comment (e.g. "more")
+                continue
+                
+            comment_data = comment_item['data']
+            if not comment_data.get('body') or comment_data['body'] == '[deleted]':
+                continue
+                
+            # Reddit sends "" rather than a listing when there are no replies
+            replies = comment_data.pop('replies', None)
+            reply_children = replies['data']['children'] if isinstance(replies, dict) else ()
+            
+            try:
+                # Fields are built from typed JSON here, so skip re-validation
+                comment_post = RedditPost.model_construct(
+                    id=comment_data['id'],
+                    post_type=PostType.COMMENT,
+                    author=comment_data.get('author', '[deleted]'),
+                    content=comment_data.get('body', ''),
+                    url=f"{self.base_url}{comment_data.get('permalink', '')}",
+                    created_at=from_utc_timestamp(comment_data.get('created_utc') or 0),
+                    score=comment_data.get('score', 0),
+                    upvotes=comment_data.get('ups', 0),
+                    replies=len(reply_children),
+                    subreddit=comment_data.get('subreddit', 'unknown'),
+                    # Replies were popped above, so a kept payload holds just this comment
+                    raw_data=comment_data if settings.store_raw_data else {}
+                )
+            except Exception as e:
+                logger.error(f"Error processing comment {comment_data.get('id', 'unknown')}: {str(e)}")
+                continue
+                
+            yield comment_post
+            comments_processed += 1
+            
+            # Descend into replies next, if they exist
+            if reply_children:
+                stack.append(iter(reply_children))
                 
-                if comment_data.get('body') and comment_data['body'] != '[deleted]':
-                    try:
-                        comment_post = RedditPost(
-                            id=comment_data['id'],
-                            post_type=PostType.COMMENT,
-                            author=comment_data.get('author', '[deleted]'),
-                            content=comment_data.get('body', ''),
-                            url=f"{self.base_url}{comment_data.get('permalink', '')}",
-                            created_at=datetime.fromtimestamp(comment_data.get('created_utc', 0)),
-                            score=comment_data.get('score', 0),
-                            upvotes=comment_data.get('ups', 0),
-                            replies=len(comment_data.get('replies', {}).get('data', {}).get('children', [])),
-                            subreddit=comment_data.get('subreddit', 'unknown'),
-                            raw_data=comment_data
-                        )
-                        
-                        yield comment_post
-                        comments_processed += 1
-                        
-                        # Process replies if they exist
-                        if comment_data.get('replies') and isinstance(comment_data['replies'], dict):
-                            replies_data = comment_data['replies'].get('data', {}).get('children', [])
-                            
-                            async for reply in self._process_comment_tree(
-                                replies_data, 
-                                max_comments - comments_processed
-                            ):
-                                yield reply
-                                comments_processed += 1
-                                
-                                if comments_processed >= max_comments:
-                                    break
-                                    
-                    except Exception as e:
-                        logger.error(f"Error processing comment {comment_data.get('id', 'unknown')}: {str(e)}")
-                        continue
-                        
     def _convert_json_to_post(self, post_data: Dict[str, Any], subreddit: str) -> RedditPost:
         """Convert Reddit JSON data to RedditPost model."""
         
         # Extract hashtags and mentions from title and selftext
-        title = post_data.get('title', '')
-        selftext = post_data.get('selftext', '')
-        combined_text = f"{title} {selftext}"
+        title = post_data.get('title') or ''
+        selftext = post_data.get('selftext') or ''
         
-        hashtags = re.findall(r'#\w+', combined_text)
-        mentions = re.findall(r'/u/(\w+)', combined_text)
+        # Scan each field in place rather than copying both into one string
+        hashtags: List[str] = []
+        mentions: List[str] = []
+        scan_tags(title, _TAGS_RE, _TAG_MARKERS, hashtags, mentions)
+        scan_tags(selftext, _TAGS_RE, _TAG_MARKERS, hashtags, mentions)
         
         # Extract media URLs
         media_urls = []
         if post_data.get('url'):
             media_urls.append(post_data['url'])
-        if post_data.get('preview', {}).get('images'):
-            for img in post_data['preview']['images']:
-                if img.get('source', {}).get('url'):
-                    media_urls.append(img['source']['url'])
+        # Most link posts carry no preview; don't build throwaway dicts for them
+        preview = post_data.get('preview')
+        images = preview.get('images') if preview else None
+        if images:
+            for img in images:
+                source = img.get('source')
+                if source and source.get('url'):
+                    media_urls.append(source['url'])
                     
-        return RedditPost(
+        # Reddit's JSON already carries the right types; skip re-validation
+        return RedditPost.model_construct(
             id=post_data['id'],
             post_type=PostType.POST,
             author=post_data.get('author', '[deleted]'),
             content=title,
             url=f"{self.base_url}{post_data.get('permalink', '')}",
-            created_at=datetime.fromtimestamp(post_data.get('created_utc', 0)),
+            created_at=from_utc_timestamp(post_data.get('created_utc') or 0),
             score=post_data.get('score', 0),
             upvotes=post_data.get('ups', 0),
             downvotes=post_data.get('downs', 0),
@@ -272,7 +305,8 @@ class RedditWebScraper(BaseScraper):
             stickied=post_data.get('stickied', False),
             locked=post_data.get('locked', False),
             
-            raw_data=post_data
+            # The raw listing entry outweighs the rest of the post; keep it only on request
+            raw_data=post_data if settings.store_raw_data else {}
         )
         
     async def get_subreddit_info(self, subreddit: str) -> Dict[str, Any]:
@@ -3,7 +3,8 @@ Twitter/X scraper implementation.
 """
 import asyncio
 import tweepy
-from typing import AsyncGenerator, Dict, List, Any, Optional
+from itertools import islice
+from typing import AsyncGenerator, Dict, Iterator, List, Any, Optional
 from datetime import datetime
 from loguru import logger
 import re
@@ -13,6 +14,39 @@ from ..config import settings
 from .base import BaseScraper
 
 
+# Tweets pulled per worker-thread hop; the largest v2 API page
+TWEET_PAGE_SIZE = 100
+
+# Smallest max_results each v2 endpoint accepts
+SEARCH_MIN_PAGE_SIZE = 10
+TIMELINE_MIN_PAGE_SIZE = 5
+
+# Per-tweet constants, bound once rather than looked up for every conversion
+_RETWEET_PREFIX = 'RT @'
+_REPLY_TYPE = PostType.REPLY
+_TWEET_TYPE = PostType.TWEET
+
+
+def _page_size(wanted: int, floor: int) -> int:
+    """Page size for fetching wanted tweets: no bigger than needed, within the API's bounds."""
+    return min(TWEET_PAGE_SIZE, max(wanted, floor))
+
+
+def _next_page(tweets: Iterator) -> list:
+    """Pull up to one page of tweets from a tweepy iterator (blocking)."""
+    return list(islice(tweets, TWEET_PAGE_SIZE))
+
+
+async def _iter_in_thread(tweets: Iterator) -> AsyncGenerator[Any, None]:
+    """Drain a blocking tweepy iterator page by page on a worker thread."""
+    while True:
+        page = await asyncio.to_thread(_next_page, tweets)
+        if not page:
+            return
+        for tweet in page:
+            yield tweet
+
+
 class TwitterScraper(BaseScraper):
     """Scraper for Twitter/X posts and replies."""
     
@@ -26,7 +60,10 @@ class TwitterScraper(BaseScraper):
         try:
             if settings.twitter_bearer_token:
                 # Twitter API v2 client with Bearer Token (App-only auth)
-                self.client = tweepy.Client(bearer_token=settings.twitter_bearer_token)
+                self.client = tweepy.Client(
+                    bearer_token=settings.twitter_bearer_token,
+                    wait_on_rate_limit=True
+                )
                 logger.info("Twitter client initialized with Bearer Token")
             elif all([
                 settings.twitter_api_key,
@@ -95,7 +132,7 @@ class TwitterScraper(BaseScraper):
             logger.info(f"Scraping timeline for @{username} (max: {max_posts})")
             
             # Get user ID first
-            user = self.client.get_user(username=username)
+            user = await asyncio.to_thread(self.client.get_user, username=username)
             if not user.data:
                 logger.error(f"User @{username} not found")
                 return
@@ -110,22 +147,13 @@ class TwitterScraper(BaseScraper):
                              'entities', 'in_reply_to_user_id', 'lang', 'source'],
                 user_fields=['verified', 'public_metrics'],
                 expansions=['author_id'],
-                max_results=min(100, max_posts),
-                limit=max(1, max_posts // 100)
+                max_results=_page_size(max_posts, TIMELINE_MIN_PAGE_SIZE)
             ).flatten(limit=max_posts)
             
-            tweets_yielded = 0
-            
-            for tweet in tweets:
-                if tweets_yielded >= max_posts:
-                    break
-                    
+            async for tweet in _iter_in_thread(tweets):
                 try:
                     twitter_post = await self._convert_tweet_to_post(tweet, user.data)
                     yield twitter_post
-                    tweets_yielded += 1
-                    
-                    await asyncio.sleep(0.1)
                     
                 except Exception as e:
                     logger.error(f"Error processing tweet {tweet.id}: {str(e)}")
@@ -151,16 +179,10 @@ class TwitterScraper(BaseScraper):
                              'entities', 'in_reply_to_user_id', 'lang', 'source'],
                 user_fields=['verified', 'public_metrics'],
                 expansions=['author_id'],
-                max_results=min(100, max_posts),
-                limit=max(1, max_posts // 100)
+                max_results=_page_size(max_posts, SEARCH_MIN_PAGE_SIZE)
             ).flatten(limit=max_posts)
             
-            tweets_yielded = 0
-            
-            for tweet in tweets:
-                if tweets_yielded >= max_posts:
-                    break
-                    
+            async for tweet in _iter_in_thread(tweets):
                 try:
                     # Get user info for this tweet
                     user_info = None
@@ -172,9 +194,6 @@ class TwitterScraper(BaseScraper):
                         
                     twitter_post = await self._convert_tweet_to_post(tweet, user_info)
                     yield twitter_post
-                    tweets_yielded += 1
-                    
-                    await asyncio.sleep(0.1)
                     
                 except Exception as e:
                     logger.error(f"Error processing search tweet {tweet.id}: {str(e)}")
@@ -206,16 +225,10 @@ class TwitterScraper(BaseScraper):
                              'entities', 'in_reply_to_user_id', 'lang', 'source', 'conversation_id'],
                 user_fields=['verified', 'public_metrics'],
                 expansions=['author_id', 'in_reply_to_user_id'],
-                max_results=min(100, max_comments),
-                limit=max(1, max_comments // 100)
+                max_results=_page_size(max_comments, SEARCH_MIN_PAGE_SIZE)
             ).flatten(limit=max_comments)
             
-            replies_yielded = 0
-            
-            for tweet in tweets:
-                if replies_yielded >= max_comments:
-                    break
-                    
+            async for tweet in _iter_in_thread(tweets):
                 try:
                     # Get user info for this tweet
                     user_info = None
@@ -227,9 +240,6 @@ class TwitterScraper(BaseScraper):
                         
                     twitter_post = await self._convert_tweet_to_post(tweet, user_info, is_reply=True)
                     yield twitter_post
-                    replies_yielded += 1
-                    
-                    await asyncio.sleep(0.1)
                     
                 except Exception as e:
                     logger.error(f"Error processing reply {tweet.id}: {str(e)}")
@@ -247,26 +257,19 @@ class TwitterScraper(BaseScraper):
     ) -> TwitterPost:
         """Convert Twitter tweet to TwitterPost model."""
         
-        # Extract hashtags and mentions
-        hashtags = []
-        mentions = []
-        media_urls = []
+        # Extract hashtags and mentions; tweepy sets entities to None when absent
+        entities = getattr(tweet, 'entities', None) or {}
+        hashtags = [f"#{tag['tag']}" for tag in entities.get('hashtags') or ()]
+        mentions = [f"@{mention['username']}" for mention in entities.get('mentions') or ()]
+        media_urls = [url['expanded_url'] for url in entities.get('urls') or () if url.get('expanded_url')]
         
-        if hasattr(tweet, 'entities'):
-            if 'hashtags' in tweet.entities:
-                hashtags = [f"#{tag['tag']}" for tag in tweet.entities['hashtags']]
-            if 'mentions' in tweet.entities:
-                mentions = [f"@{mention['username']}" for mention in tweet.entities['mentions']]
-            if 'urls' in tweet.entities:
-                media_urls = [url['expanded_url'] for url in tweet.entities['urls'] if url.get('expanded_url')]
-                
         # Get engagement metrics
         public_metrics = getattr(tweet, 'public_metrics', {})
         
         return TwitterPost(
             id=str(tweet.id),
             tweet_id=str(tweet.id),
-            post_type=PostType.REPLY if is_reply else PostType.TWEET,
+            post_type=_REPLY_TYPE if is_reply else _TWEET_TYPE,
             author=user_info.username if user_info else f"user_{tweet.author_id}",
             content=tweet.text,
             url=f"https://twitter.com/user/status/{tweet.id}",
@@ -280,7 +283,7 @@ class TwitterScraper(BaseScraper):
             # Twitter-specific fields
             in_reply_to_user_id=getattr(tweet, 'in_reply_to_user_id', None),
             in_reply_to_tweet_id=None,  # Not available in API v2
-            is_retweet=tweet.text.startswith('RT @'),
+            is_retweet=tweet.text.startswith(_RETWEET_PREFIX),
             lang=getattr(tweet, 'lang', None),
             source=getattr(tweet, 'source', None),
             verified=user_info.verified if user_info else False,
@@ -337,7 +340,8 @@ class TwitterScraper(BaseScraper):
             raise ValueError("Twitter client not initialized")
             
         try:
-            user = self.client.get_user(
+            user = await asyncio.to_thread(
+                self.client.get_user,
                 username=username,
                 user_fields=['created_at', 'description', 'location', 'public_metrics', 'verified']
             )
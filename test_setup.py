@@ -3,84 +3,99 @@ Test script to verify the web scraper setup.
 """
 import asyncio
 import sys
-import os
+from typing import List
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+# Run the checks on uvloop when it is installed, as the CLI does
+if sys.platform != "win32":
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
 
-from src.database import db_manager
-from src.config import settings
-from src.models import Platform
+# Plain ASCII status markers; emoji fail to encode on cp1252 consoles and
+# redirected Windows output, which is where a setup check is most often run
+OK = "[OK]"
+FAIL = "[FAIL]"
 
 
-def test_config():
+def test_config(out: List[str]) -> bool:
     """Test configuration loading."""
-    print("🔧 Testing configuration...")
-    print(f"   Database URL: {settings.database_url}")
-    print(f"   Max concurrent requests: {settings.max_concurrent_requests}")
-    print(f"   Rate limit: {settings.rate_limit_requests}/{settings.rate_limit_window}s")
-    print("✅ Configuration loaded successfully")
+    from src.config import settings
+    
+    out.append("Testing configuration...")
+    out.append(f"   Database URL: {settings.database_url}")
+    out.append(f"   Max concurrent requests: {settings.max_concurrent_requests}")
+    out.append(f"   Rate limit: {settings.rate_limit_requests}/{settings.rate_limit_window}s")
+    out.append(f"{OK} Configuration loaded successfully")
+    return True
 
 
-def test_database():
+def test_database(out: List[str]) -> bool:
     """Test database setup."""
-    print("\n💾 Testing database...")
+    out.append("\nTesting database...")
     try:
+        from sqlalchemy import text
+        from src.database import db_manager
+        
         db_manager.create_tables()
-        print("✅ Database tables created successfully")
+        out.append(f"{OK} Database tables created successfully")
         
-        # Test database connection
-        with db_manager.get_session() as db:
-            from src.database import ScrapingJobDB
-            count = db.query(ScrapingJobDB).count()
-            print(f"   Current jobs in database: {count}")
+        # Test database connection; a constant query costs the same at any table size
+        with db_manager.engine.connect() as conn:
+            conn.execute(text("SELECT 1")).scalar()
+            out.append("   Database connection OK")
             
     except Exception as e:
-        print(f"❌ Database test failed: {e}")
+        out.append(f"{FAIL} Database test failed: {e}")
         return False
     return True
 
 
-async def test_scrapers():
+async def test_scrapers(out: List[str]) -> bool:
     """Test scraper initialization."""
-    print("\n🕷️  Testing scrapers...")
+    out.append("\nTesting scrapers...")
     
     try:
+        from src.models import Platform
         from src.scrapers.manager import scraper_manager
         
         async with scraper_manager:
-            print("✅ Scraper manager initialized")
+            out.append(f"{OK} Scraper manager initialized")
             
-            # Test health check
-            health = await scraper_manager.health_check()
-            print(f"   Health status: {health}")
-            
-            # Test creating a job (without running it)
-            job_id = await scraper_manager.create_job(
-                platform=Platform.REDDIT,
-                target="test",
-                max_posts=1
+            # Run the health check and create a test job (it starts running
+            # in the background) together; neither waits on the other
+            health, job_id = await asyncio.gather(
+                scraper_manager.health_check(),
+                scraper_manager.create_job(
+                    platform=Platform.REDDIT,
+                    target="test",
+                    max_posts=1
+                )
             )
-            print(f"✅ Test job created: {job_id}")
+            out.append(f"   Health status: {health}")
+            out.append(f"{OK} Test job created: {job_id}")
             
             # Check job status
             status = await scraper_manager.get_job_status(job_id)
-            print(f"   Job status: {status['status']}")
+            out.append(f"   Job status: {status['status']}")
             
     except Exception as e:
-        print(f"❌ Scraper test failed: {e}")
+        out.append(f"{FAIL} Scraper test failed: {e}")
         return False
     return True
 
 
-def test_models():
+def test_models(out: List[str]) -> bool:
     """Test data models."""
-    print("\n📋 Testing data models...")
+    out.append("\nTesting data models...")
     
     try:
         from src.models import RedditPost, TwitterPost, PostType
         from datetime import datetime
         
+        now = datetime.utcnow()
+        
         # Test Reddit post model
         reddit_post = RedditPost(
             id="test123",
@@ -88,10 +103,10 @@ def test_models():
             author="test_user",
             content="Test post content",
             url="https://reddit.com/test",
-            created_at=datetime.utcnow(),
+            created_at=now,
             subreddit="test"
         )
-        print("✅ Reddit post model works")
+        out.append(f"{OK} Reddit post model works")
         
         # Test Twitter post model
         twitter_post = TwitterPost(
@@ -101,52 +116,54 @@ def test_models():
             author="test_user",
             content="Test tweet content",
             url="https://twitter.com/test",
-            created_at=datetime.utcnow()
+            created_at=now
         )
-        print("✅ Twitter post model works")
+        out.append(f"{OK} Twitter post model works")
         
     except Exception as e:
-        print(f"❌ Model test failed: {e}")
+        out.append(f"{FAIL} Model test failed: {e}")
         return False
     return True
 
 
 async def main():
     """Run all tests."""
-    print("🧪 Running Web Scraper Tests\n")
-    
-    success = True
-    
-    # Test configuration
-    try:
-        test_config()
-    except Exception as e:
-        print(f"❌ Configuration test failed: {e}")
-        success = False
+    print("Running Web Scraper Tests\n")
     
-    # Test models
-    if not test_models():
-        success = False
+    # Each test collects its own output so the concurrent runs don't interleave
+    outputs = {name: [] for name in ("Configuration", "Model", "Database", "Scraper")}
     
-    # Test database
-    if not test_database():
-        success = False
+    # The phases are independent: sync ones run on worker threads while the
+    # scraper test waits on the network
+    results = await asyncio.gather(
+        asyncio.to_thread(test_config, outputs["Configuration"]),
+        asyncio.to_thread(test_models, outputs["Model"]),
+        asyncio.to_thread(test_database, outputs["Database"]),
+        test_scrapers(outputs["Scraper"]),
+        return_exceptions=True
+    )
     
-    # Test scrapers
-    if not await test_scrapers():
-        success = False
+    success = True
+    lines: List[str] = []
+    for (name, out), result in zip(outputs.items(), results):
+        if isinstance(result, Exception):
+            out.append(f"{FAIL} {name} test failed: {result}")
+        if result is not True:
+            success = False
+        lines.extend(out)
     
-    print(f"\n{'🎉 All tests passed!' if success else '❌ Some tests failed'}")
+    lines.append(f"\n{OK} All tests passed!" if success else f"\n{FAIL} Some tests failed")
     
     if success:
-        print("\n📋 Setup verification completed successfully!")
-        print("   You can now use the scraper with:")
-        print("   python main.py --help")
+        lines.append("\nSetup verification completed successfully!")
+        lines.append("   You can now use the scraper with:")
+        lines.append("   python main.py --help")
     else:
-        print("\n⚠️  Please check the error messages above and fix any issues.")
-        return 1
-    
-    return 0
+        lines.append("\nPlease check the error messages above and fix any issues.")
+        
+    # The report is complete by now, so write it in one go
+    sys.stdout.write("\n".join(lines) + "\n")
+    return 0 if success else 1
 
 
 if __name__ == "__main__":